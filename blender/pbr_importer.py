@@ -29,6 +29,20 @@ from bpy.props import StringProperty, BoolProperty, FloatProperty
 from bpy_extras.io_utils import ImportHelper
 
 
+# Filename keywords identifying each texture type, checked in order
+TEXTURE_KEYWORDS = (
+    ('diffuse', ('diffuse', 'albedo', 'color', 'basecolor')),
+    ('normal', ('normal', 'norm', 'nrm')),
+    ('roughness', ('roughness', 'rough', 'rgh')),
+    ('metallic', ('metallic', 'metal', 'met')),
+    ('height', ('height', 'displacement', 'disp', 'bump')),
+    ('ao', ('ao', 'ambient_occlusion', 'occlusion', 'occ')),
+)
+
+# Supported image extensions
+TEXTURE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.tif', '.tiff', '.exr'})
+
+
 class PBR_OT_import_texture_set(bpy.types.Operator, ImportHelper):
     """Import a PBR texture set and create a material"""
     bl_idname = "import_texture.pbr_set"
@@ -100,31 +114,17 @@ class PBR_OT_import_texture_set(bpy.types.Operator, ImportHelper):
     
     def find_texture_files(self, folder_path):
         """Find all PBR texture files in the folder"""
-        texture_types = {
-            'diffuse': ['diffuse', 'albedo', 'color', 'basecolor'],
-            'normal': ['normal', 'norm', 'nrm'],
-            'roughness': ['roughness', 'rough', 'rgh'],
-            'metallic': ['metallic', 'metal', 'met'],
-            'height': ['height', 'displacement', 'disp', 'bump'],
-            'ao': ['ao', 'ambient_occlusion', 'occlusion', 'occ']
-        }
-        
         found_textures = {}
         
-        # Supported image extensions
-        extensions = ['.png', '.jpg', '.jpeg', '.tif', '.tiff', '.exr']
-        
         # Search for texture files
         for file_path in folder_path.iterdir():
-            if file_path.is_file() and file_path.suffix.lower() in extensions:
+            if file_path.suffix.lower() in TEXTURE_EXTENSIONS and file_path.is_file():
                 filename_lower = file_path.stem.lower()
                 
                 # Check each texture type
-                for tex_type, keywords in texture_types.items():
-                    for keyword in keywords:
-                        if keyword in filename_lower:
-                            found_textures[tex_type] = file_path
-                            break
+                for tex_type, keywords in TEXTURE_KEYWORDS:
+                    if any(keyword in filename_lower for keyword in keywords):
+                        found_textures[tex_type] = file_path
         
         return found_textures
     
@@ -156,7 +156,7 @@ def main():
     parser.add_argument("--benchmark", action="store_true", help="Run performance benchmarks")
     
     # Execution arguments
-    parser.add_argument("--parallel", type=int, metavar="N", help="Run tests in parallel with N workers")
+    parser.add_argument("--parallel", metavar="N", help="Run tests in parallel with N workers ('auto' for one per CPU)")
     parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
     
     # Path arguments
@@ -44,7 +44,8 @@ CONFIG_SCHEMA = {
                         "type": "string",
                         "enum": ["diffuse", "normal", "roughness", "metallic", "ao", "height", "emissive"]
                     }
-                }
+                },
+                "seamless_threshold": {"type": "number", "minimum": 0, "maximum": 1}
             },
             "required": ["resolution", "format", "types"]
         },
@@ -75,9 +76,18 @@ CONFIG_SCHEMA = {
             "properties": {
                 "directory": {"type": "string"},
                 "naming_convention": {"type": "string"},
-                "create_preview": {"type": "boolean"}
+                "create_preview": {"type": "boolean"},
+                "compress_level": {"type": "integer", "minimum": 0, "maximum": 9}
             },
             "required": ["directory"]
+        },
+        "cache": {
+            "type": "object",
+            "properties": {
+                "enabled": {"type": "boolean"},
+                "directory": {"type": "string"},
+                "ttl": {"type": "number"}
+            }
         }
     },
     "required": ["project", "textures", "material", "output"]
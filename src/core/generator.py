@@ -2,13 +2,14 @@
 
 import asyncio
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, TYPE_CHECKING
+from typing import Callable, Dict, List, Optional, TYPE_CHECKING
 from ..types.config import Config
 from ..types.results import GenerationResult
 from ..types.common import TextureType
 from ..interfaces.openai_api import OpenAIInterface
-from ..utils.file_handlers import save_texture
+from ..utils.file_handlers import save_image, save_texture
 from ..utils.logging import get_logger
 from ..utils.image_utils import resize_image
 from ..utils.progress import api_progress
@@ -20,9 +21,6 @@ from ..utils.tessellation import apply_tessellation
 from PIL import Image
 import numpy as np
 
-# Import preview generation
-from ..utils.preview import generate_material_preview
-
 # Import all texture generation modules
 from ..modules import (
     DiffuseModule,
@@ -37,6 +35,9 @@ from ..modules import (
 
 logger = get_logger(__name__)
 
+# Upper bound on derived maps computed concurrently
+_MAX_DERIVE_WORKERS = 4
+
 
 async def generate_textures_with_progress(config: Config, progress_tracker: Optional['ProgressTracker'] = None) -> List[GenerationResult]:
     """Generate PBR textures with progress tracking.
@@ -185,7 +186,12 @@ async def _generate_diffuse_map(config: Config) -> GenerationResult:
     
     try:
         # Initialize OpenAI interface
-        openai_interface = OpenAIInterface(api_key=config.api_key, org_id=config.org_id)
+        openai_interface = OpenAIInterface(
+            api_key=config.api_key,
+            org_id=config.org_id,
+            cache_dir=config.cache_directory,
+            cache_ttl=config.cache_ttl,
+        )
         
         # Prepare the diffuse map prompt
         resolution = config.texture_config.resolution
@@ -210,7 +216,9 @@ async def _generate_diffuse_map(config: Config) -> GenerationResult:
         if image_data:
             # Save the diffuse map
             file_path = _get_texture_path(config, TextureType.DIFFUSE)
-            save_texture(image_data, str(file_path))
+            await asyncio.get_running_loop().run_in_executor(
+                None, save_texture, image_data, str(file_path), config.png_compress_level
+            )
             logger.info(f"Diffuse map saved to: {file_path}")
             
             return GenerationResult(
@@ -253,7 +261,12 @@ async def _generate_diffuse_map_with_progress(config: Config, progress_tracker:
     
     try:
         # Initialize OpenAI interface
-        openai_interface = OpenAIInterface(api_key=config.api_key, org_id=config.org_id)
+        openai_interface = OpenAIInterface(
+            api_key=config.api_key,
+            org_id=config.org_id,
+            cache_dir=config.cache_directory,
+            cache_ttl=config.cache_ttl,
+        )
         
         # Prepare the diffuse map prompt
         progress_tracker.update_step("Building prompt", "processing")
@@ -283,7 +296,9 @@ async def _generate_diffuse_map_with_progress(config: Config, progress_tracker:
         if image_data:
             # Save the diffuse map
             file_path = _get_texture_path(config, TextureType.DIFFUSE)
-            save_texture(image_data, str(file_path))
+            await asyncio.get_running_loop().run_in_executor(
+                None, save_texture, image_data, str(file_path), config.png_compress_level
+            )
             logger.info(f"Diffuse map saved to: {file_path}")
             
             progress_tracker.update_step("Saved successfully", "complete")
@@ -329,19 +344,14 @@ async def _apply_tessellation(diffuse_path: str, config: Config) -> str:
     logger.info("Applying tessellation for seamless tiling")
     
     try:
-        # Load the diffuse map
-        diffuse_image = Image.open(diffuse_path)
-        
-        # Apply tessellation for seamless tiling
-        tessellated_image = apply_tessellation(diffuse_image, blend_width=50)
-        
-        # Save tessellated version with suffix
-        path_obj = Path(diffuse_path)
-        tessellated_path = path_obj.parent / f"{path_obj.stem}_tessellated{path_obj.suffix}"
-        tessellated_image.save(str(tessellated_path))
+        # Decode, blend and PNG-encode off the event loop
+        loop = asyncio.get_running_loop()
+        tessellated_path = await loop.run_in_executor(
+            None, _tessellate_and_save, diffuse_path, config.png_compress_level
+        )
         
         logger.info(f"Tessellated diffuse saved to: {tessellated_path}")
-        return str(tessellated_path)
+        return tessellated_path
         
     except Exception as e:
         logger.error(f"Error applying tessellation: {e}")
@@ -349,6 +359,62 @@ async def _apply_tessellation(diffuse_path: str, config: Config) -> str:
         return diffuse_path
 
 
+def _tessellate_and_save(diffuse_path: str, compress_level: int) -> str:
+    """Load the diffuse map, make it tile seamlessly and save it alongside.
+    
+    Args:
+        diffuse_path: Path to the diffuse map.
+        compress_level: zlib level used if the map is saved as PNG.
+        
+    Returns:
+        Path to the tessellated diffuse map.
+    """
+    # Load the diffuse map
+    with Image.open(diffuse_path) as diffuse_image:
+        # Apply tessellation for seamless tiling
+        tessellated_image = apply_tessellation(diffuse_image, blend_width=50)
+    
+    # Save tessellated version with suffix
+    path_obj = Path(diffuse_path)
+    tessellated_path = path_obj.parent / f"{path_obj.stem}_tessellated{path_obj.suffix}"
+    save_image(tessellated_image, tessellated_path, compress_level)
+    return str(tessellated_path)
+
+
+def _derive_in_worker(
+    derive_func: Callable[[str, Config, TextureType], GenerationResult],
+    diffuse_path: str,
+    config: Config,
+    texture_type: TextureType
+) -> GenerationResult:
+    """Run one map derivation on a worker thread.
+    
+    Errors that escape the derivation function become a failed result
+    timed from when this map started, not from when the batch began.
+    
+    Args:
+        derive_func: Derivation function for the texture type.
+        diffuse_path: Path to the tessellated diffuse map.
+        config: Configuration object.
+        texture_type: Texture type being derived.
+        
+    Returns:
+        GenerationResult for the derived map.
+    """
+    start_time = time.time()
+    try:
+        return derive_func(diffuse_path, config, texture_type)
+    except Exception as e:
+        logger.error(f"Error deriving {texture_type.value} map: {e}")
+        return GenerationResult(
+            texture_type=texture_type,
+            file_path="",
+            generation_time=time.time() - start_time,
+            success=False,
+            error_message=str(e)
+        )
+
+
 async def _derive_pbr_maps(diffuse_path: str, config: Config) -> List[GenerationResult]:
     """Derive PBR maps from the tessellated diffuse map.
     
@@ -359,7 +425,7 @@ async def _derive_pbr_maps(diffuse_path: str, config: Config) -> List[Generation
     Returns:
         List of GenerationResult for derived maps.
     """
-    results = []
+    results: List[GenerationResult] = []
     
     # Map texture types to their derivation modules
     derivation_modules = {
@@ -371,33 +437,36 @@ async def _derive_pbr_maps(diffuse_path: str, config: Config) -> List[Generation
         TextureType.EMISSIVE: _derive_emissive_map,
     }
     
-    # Process each requested texture type (except diffuse which is already done)
+    # Collect each requested texture type (except diffuse which is already done)
+    pending = []
     for texture_type in config.texture_config.types:
         if texture_type == TextureType.DIFFUSE:
             continue  # Already generated
-            
+        
         if texture_type in derivation_modules:
-            logger.info(f"Deriving {texture_type.value} map")
-            start_time = time.time()
-            
-            try:
-                # Call the appropriate derivation module
-                derive_func = derivation_modules[texture_type]
-                result = await derive_func(diffuse_path, config, texture_type)
-                results.append(result)
-                
-            except Exception as e:
-                logger.error(f"Error deriving {texture_type.value} map: {e}")
-                results.append(GenerationResult(
-                    texture_type=texture_type,
-                    file_path="",
-                    generation_time=time.time() - start_time,
-                    success=False,
-                    error_message=str(e)
-                ))
+            pending.append(texture_type)
         else:
             logger.warning(f"No derivation module for texture type: {texture_type.value}")
     
+    if not pending:
+        return results
+    
+    # The maps only read the diffuse file and spend most of their time in
+    # NumPy/SciPy/OpenCV calls that release the GIL, so derive them on a
+    # thread pool instead of one after another
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=min(len(pending), _MAX_DERIVE_WORKERS)) as executor:
+        futures = []
+        for texture_type in pending:
+            logger.info(f"Deriving {texture_type.value} map")
+            futures.append(loop.run_in_executor(
+                executor, _derive_in_worker, derivation_modules[texture_type],
+                diffuse_path, config, texture_type
+            ))
+        # Each worker turns its own errors into a failed result, and
+        # gather keeps the requested order
+        results.extend(await asyncio.gather(*futures))
+    
     return results
 
 
@@ -412,7 +481,7 @@ async def _derive_pbr_maps_with_progress(diffuse_path: str, config: Config, prog
     Returns:
         List of GenerationResult for derived maps.
     """
-    results = []
+    results: List[GenerationResult] = []
     
     # Map texture types to their derivation modules
     derivation_modules = {
@@ -424,50 +493,53 @@ async def _derive_pbr_maps_with_progress(diffuse_path: str, config: Config, prog
         TextureType.EMISSIVE: _derive_emissive_map,
     }
     
-    # Process each requested texture type (except diffuse which is already done)
+    # Collect each requested texture type (except diffuse which is already done)
+    pending = []
     for texture_type in config.texture_config.types:
         if texture_type == TextureType.DIFFUSE:
             continue  # Already generated
             
         if texture_type in derivation_modules:
-            # Start progress tracking for this texture
-            progress_tracker.start_texture(texture_type.value, steps=2)
-            progress_tracker.update_step("Processing image data", "processing")
-            
-            logger.info(f"Deriving {texture_type.value} map")
-            start_time = time.time()
-            
-            try:
-                # Call the appropriate derivation module
-                derive_func = derivation_modules[texture_type]
-                result = await derive_func(diffuse_path, config, texture_type)
-                results.append(result)
-                
-                # Complete progress tracking
-                if result.success:
-                    progress_tracker.complete_texture(texture_type.value, success=True)
-                else:
-                    progress_tracker.complete_texture(texture_type.value, success=False, error=result.error_message)
-                
-            except Exception as e:
-                logger.error(f"Error deriving {texture_type.value} map: {e}")
-                error_result = GenerationResult(
-                    texture_type=texture_type,
-                    file_path="",
-                    generation_time=time.time() - start_time,
-                    success=False,
-                    error_message=str(e)
-                )
-                results.append(error_result)
-                progress_tracker.complete_texture(texture_type.value, success=False, error=str(e))
+            pending.append(texture_type)
         else:
             logger.warning(f"No derivation module for texture type: {texture_type.value}")
             progress_tracker.add_warning(f"No derivation module for texture type: {texture_type.value}")
     
+    if not pending:
+        return results
+    
+    # The maps are derived concurrently, so the bar shows them together
+    progress_tracker.start_texture(", ".join(t.value for t in pending), steps=2)
+    progress_tracker.update_step("Processing image data", "processing")
+    
+    # Same thread pool as _derive_pbr_maps; progress is reported as each
+    # map finishes and the results are returned in the requested order
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=min(len(pending), _MAX_DERIVE_WORKERS)) as executor:
+        futures = []
+        for texture_type in pending:
+            logger.info(f"Deriving {texture_type.value} map")
+            futures.append(loop.run_in_executor(
+                executor, _derive_in_worker, derivation_modules[texture_type],
+                diffuse_path, config, texture_type
+            ))
+        
+        completed: Dict[TextureType, GenerationResult] = {}
+        for future in asyncio.as_completed(futures):
+            result = await future
+            completed[result.texture_type] = result
+            
+            # Complete progress tracking
+            if result.success:
+                progress_tracker.complete_texture(result.texture_type.value, success=True)
+            else:
+                progress_tracker.complete_texture(result.texture_type.value, success=False, error=result.error_message)
+    
+    results.extend(completed[texture_type] for texture_type in pending)
     return results
 
 
-async def _derive_normal_map(diffuse_path: str, config: Config, texture_type: TextureType) -> GenerationResult:
+def _derive_normal_map(diffuse_path: str, config: Config, texture_type: TextureType) -> GenerationResult:
     """Derive normal map from diffuse using NormalModule."""
     start_time = time.time()
     file_path = _get_texture_path(config, texture_type)
@@ -483,7 +555,7 @@ async def _derive_normal_map(diffuse_path: str, config: Config, texture_type: Te
         normal_map = normal_module.generate(input_data={"diffuse_map": diffuse_image})
         
         # Save the normal map
-        normal_map.save(str(file_path))
+        save_image(normal_map, file_path, config.png_compress_level)
         logger.info(f"Normal map saved to: {file_path}")
         
         return GenerationResult(
@@ -504,7 +576,7 @@ async def _derive_normal_map(diffuse_path: str, config: Config, texture_type: Te
         )
 
 
-async def _derive_roughness_map(diffuse_path: str, config: Config, texture_type: TextureType) -> GenerationResult:
+def _derive_roughness_map(diffuse_path: str, config: Config, texture_type: TextureType) -> GenerationResult:
     """Derive roughness map from diffuse using RoughnessModule."""
     start_time = time.time()
     file_path = _get_texture_path(config, texture_type)
@@ -536,7 +608,7 @@ async def _derive_roughness_map(diffuse_path: str, config: Config, texture_type:
         roughness_map = roughness_module.generate(diffuse_image)
         
         # Save the roughness map
-        roughness_map.save(str(file_path))
+        save_image(roughness_map, file_path, config.png_compress_level)
         logger.info(f"Roughness map saved to: {file_path}")
         
         return GenerationResult(
@@ -557,7 +629,7 @@ async def _derive_roughness_map(diffuse_path: str, config: Config, texture_type:
         )
 
 
-async def _derive_metallic_map(diffuse_path: str, config: Config, texture_type: TextureType) -> GenerationResult:
+def _derive_metallic_map(diffuse_path: str, config: Config, texture_type: TextureType) -> GenerationResult:
     """Derive metallic map from diffuse using MetallicModule."""
     start_time = time.time()
     file_path = _get_texture_path(config, texture_type)
@@ -573,7 +645,7 @@ async def _derive_metallic_map(diffuse_path: str, config: Config, texture_type:
         metallic_map = metallic_module.generate(input_data={"diffuse_map": diffuse_image})
         
         # Save the metallic map
-        metallic_map.save(str(file_path))
+        save_image(metallic_map, file_path, config.png_compress_level)
         logger.info(f"Metallic map saved to: {file_path}")
         
         return GenerationResult(
@@ -594,7 +666,7 @@ async def _derive_metallic_map(diffuse_path: str, config: Config, texture_type:
         )
 
 
-async def _derive_ambient_occlusion_map(diffuse_path: str, config: Config, texture_type: TextureType) -> GenerationResult:
+def _derive_ambient_occlusion_map(diffuse_path: str, config: Config, texture_type: TextureType) -> GenerationResult:
     """Derive ambient occlusion map from diffuse using AmbientOcclusionModule."""
     start_time = time.time()
     file_path = _get_texture_path(config, texture_type)
@@ -610,7 +682,7 @@ async def _derive_ambient_occlusion_map(diffuse_path: str, config: Config, textu
         ao_map = ao_module.generate(input_data={"diffuse_map": diffuse_image})
         
         # Save the AO map
-        ao_map.save(str(file_path))
+        save_image(ao_map, file_path, config.png_compress_level)
         logger.info(f"Ambient occlusion map saved to: {file_path}")
         
         return GenerationResult(
@@ -631,7 +703,7 @@ async def _derive_ambient_occlusion_map(diffuse_path: str, config: Config, textu
         )
 
 
-async def _derive_height_map(diffuse_path: str, config: Config, texture_type: TextureType) -> GenerationResult:
+def _derive_height_map(diffuse_path: str, config: Config, texture_type: TextureType) -> GenerationResult:
     """Derive height/displacement map from diffuse using HeightModule."""
     start_time = time.time()
     file_path = _get_texture_path(config, texture_type)
@@ -647,7 +719,7 @@ async def _derive_height_map(diffuse_path: str, config: Config, texture_type: Te
         height_map = height_module.generate(input_data={"diffuse_map": diffuse_image})
         
         # Save the height map
-        height_map.save(str(file_path))
+        save_image(height_map, file_path, config.png_compress_level)
         logger.info(f"Height map saved to: {file_path}")
         
         return GenerationResult(
@@ -668,7 +740,7 @@ async def _derive_height_map(diffuse_path: str, config: Config, texture_type: Te
         )
 
 
-async def _derive_emissive_map(diffuse_path: str, config: Config, texture_type: TextureType) -> GenerationResult:
+def _derive_emissive_map(diffuse_path: str, config: Config, texture_type: TextureType) -> GenerationResult:
     """Derive emissive map from diffuse using EmissiveModule."""
     start_time = time.time()
     file_path = _get_texture_path(config, texture_type)
@@ -684,7 +756,7 @@ async def _derive_emissive_map(diffuse_path: str, config: Config, texture_type:
         emissive_map = emissive_module.generate(input_data={"diffuse_map": diffuse_image})
         
         # Save the emissive map
-        emissive_map.save(str(file_path))
+        save_image(emissive_map, file_path, config.png_compress_level)
         logger.info(f"Emissive map saved to: {file_path}")
         
         return GenerationResult(
@@ -735,6 +807,9 @@ async def _generate_preview(results: List[GenerationResult], config: Config) ->
         Path to preview image if successful, None otherwise
     """
     try:
+        # Imported on first use: runs without a preview never load the renderer
+        from ..utils.preview import generate_material_preview
+        
         # Build texture paths dictionary from results
         texture_paths = {}
         for result in results:
@@ -1,25 +1,90 @@
 """OpenAI API interface for image generation."""
 
+import asyncio
 import base64
+import hashlib
+import os
+import time
 import aiohttp
 import json
-from typing import Optional
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# HTTP statuses worth retrying: rate limiting and transient server errors
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class _DiskCache:
+    """File-backed cache of generated images keyed by request parameters."""
+
+    def __init__(self, directory: str, ttl: float = 3600.0):
+        """
+        Initializes the cache.
+        Args:
+            directory: Directory holding the cached image files.
+            ttl: Seconds a cached image stays valid; 0 or less never expires.
+        """
+        self.directory = Path(directory)
+        self.ttl = ttl
+
+    @staticmethod
+    def key(payload: Dict[str, Any]) -> str:
+        """Hash the request fields that determine the generated image."""
+        fields = (payload["prompt"], payload["size"], payload["quality"], payload["model"], payload["n"])
+        return hashlib.blake2b("|".join(map(str, fields)).encode(), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached image bytes, or None on a miss or expired entry."""
+        path = self.directory / f"{key}.img"
+        try:
+            if self.ttl > 0 and time.time() - path.stat().st_mtime >= self.ttl:
+                return None
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    def put(self, key: str, image_data: bytes) -> None:
+        """Store image bytes, replacing any existing entry atomically."""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self.directory / f"{key}.img"
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(image_data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Failed to write image cache entry: {e}")
 
 class OpenAIInterface:
     """Interface for OpenAI API."""
 
-    def __init__(self, api_key: str, org_id: Optional[str] = None, api_url: str = "https://api.openai.com/v1/images/generations"):
+    def __init__(
+        self,
+        api_key: str,
+        org_id: Optional[str] = None,
+        api_url: str = "https://api.openai.com/v1/images/generations",
+        retries: int = 3,
+        retry_delay: float = 1.0,
+        cache_dir: Optional[str] = None,
+        cache_ttl: float = 3600.0,
+    ):
         """
         Initializes the OpenAIInterface.
         Args:
             api_key: The OpenAI API key.
             org_id: The OpenAI organization ID.
             api_url: The URL for the image generation endpoint.
+            retries: Maximum number of attempts for transient failures.
+            retry_delay: Delay in seconds before the first retry; doubles on each further retry.
+            cache_dir: Directory for caching generated images; None disables caching.
+            cache_ttl: Seconds a cached image stays valid; 0 or less never expires.
         """
         if not api_key:
             raise ValueError("OpenAI API key is required.")
         self.api_key = api_key
         self.api_url = api_url
+        self.retries = max(1, retries)
+        self.retry_delay = retry_delay
+        self.cache = _DiskCache(cache_dir, cache_ttl) if cache_dir else None
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
@@ -53,32 +118,65 @@ class OpenAIInterface:
             "size": size,
             "quality": quality,
         }
+        # Identical requests are served from disk instead of the API
+        if self.cache is None:
+            return await self._request_image(payload)
+        cache_key = self.cache.key(payload)
+        image_data = self.cache.get(cache_key)
+        if image_data is not None:
+            return image_data
+        image_data = await self._request_image(payload)
+        if image_data is not None:
+            self.cache.put(cache_key, image_data)
+        return image_data
+
+    async def _request_image(self, payload: Dict[str, Any]) -> Optional[bytes]:
+        """
+        Sends an image generation request, retrying transient failures.
+        Args:
+            payload: The JSON body for the image generation endpoint.
+        Returns:
+            The image data in bytes, or None if an error occurred.
+        """
         async with aiohttp.ClientSession() as session:
-            try:
-                async with session.post(self.api_url, json=payload, headers=self.headers, timeout=120) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        print(f"HTTP error occurred: {response.status} - {error_text}")
-                        return None
-
-                    response_json = await response.json()
-                    print(f"OpenAI API Response: {json.dumps(response_json, indent=2)}")
-
-                    # Check for b64_json first
-                    if "b64_json" in response_json["data"][0]:
-                        image_data = base64.b64decode(response_json["data"][0]["b64_json"])
-                        return image_data
-
-                    # Fallback to URL
-                    image_url = response_json["data"][0]["url"]
-                    async with session.get(image_url) as image_response:
-                        if image_response.status != 200:
-                            error_text = await image_response.text()
-                            print(f"Failed to download image: {image_response.status} - {error_text}")
+            for attempt in range(self.retries):
+                if attempt:
+                    # Exponential backoff between attempts
+                    await asyncio.sleep(self.retry_delay * (2 ** (attempt - 1)))
+                try:
+                    async with session.post(self.api_url, json=payload, headers=self.headers, timeout=120) as response:
+                        if response.status != 200:
+                            error_text = await response.text()
+                            print(f"HTTP error occurred: {response.status} - {error_text}")
+                            if response.status in _RETRYABLE_STATUSES:
+                                continue
                             return None
-                        image_data = await image_response.read()
-                        return image_data
 
-            except Exception as e:
-                print(f"An error occurred: {e}")
-                return None
\ No newline at end of file
+                        response_json = await response.json()
+                        print(f"OpenAI API Response: {json.dumps(response_json, indent=2)}")
+
+                        # Check for b64_json first
+                        if "b64_json" in response_json["data"][0]:
+                            image_data = base64.b64decode(response_json["data"][0]["b64_json"])
+                            return image_data
+
+                        # Fallback to URL
+                        image_url = response_json["data"][0]["url"]
+                        async with session.get(image_url) as image_response:
+                            if image_response.status != 200:
+                                error_text = await image_response.text()
+                                print(f"Failed to download image: {image_response.status} - {error_text}")
+                                return None
+                            image_data = await image_response.read()
+                            return image_data
+
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    # Connection resets and timeouts are transient; anything
+                    # else is deterministic and retrying won't help
+                    print(f"Transient error on attempt {attempt + 1}/{self.retries}: {e!r}")
+                except Exception as e:
+                    print(f"An error occurred: {e}")
+                    return None
+
+            print(f"Image generation failed after {self.retries} attempts")
+            return None
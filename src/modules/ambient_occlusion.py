@@ -127,10 +127,7 @@ class AmbientOcclusionModule(TextureGenerator):
             
             # Resize if needed
             if height_input.size != (self.resolution.width, self.resolution.height):
-                height_input = height_input.resize(
-                    (self.resolution.width, self.resolution.height),
-                    Image.Resampling.LANCZOS
-                )
+                height_input = self._resize_to_resolution(height_input)
             
             height_array = np.array(height_input, dtype=np.float32) / 255.0
         elif isinstance(height_input, np.ndarray):
@@ -157,10 +154,7 @@ class AmbientOcclusionModule(TextureGenerator):
         if isinstance(diffuse_map, Image.Image):
             # Resize if needed
             if diffuse_map.size != (self.resolution.width, self.resolution.height):
-                diffuse_map = diffuse_map.resize(
-                    (self.resolution.width, self.resolution.height),
-                    Image.Resampling.LANCZOS
-                )
+                diffuse_map = self._resize_to_resolution(diffuse_map)
             
             # Convert to RGB if needed
             if diffuse_map.mode != 'RGB':
@@ -289,7 +283,7 @@ class AmbientOcclusionModule(TextureGenerator):
         grad_y = ndimage.sobel(height_map, axis=1)
         
         # Gradient magnitude
-        gradient_mag = np.sqrt(grad_x**2 + grad_y**2)
+        gradient_mag = np.hypot(grad_x, grad_y)
         
         # Normalize and invert (high gradient = more occlusion)
         gradient_mag = gradient_mag / (gradient_mag.max() + 1e-6)
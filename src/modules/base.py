@@ -9,6 +9,10 @@ from ..types.config import Config, MaterialProperties
 from ..types.common import TextureType
 
 
+# Downscales of at least twice this factor are pre-shrunk with Image.reduce
+_RESIZE_REDUCING_GAP = 3.0
+
+
 class TextureGenerator(ABC):
     """Base class for texture generation modules."""
     
@@ -22,6 +26,7 @@ class TextureGenerator(ABC):
         self.material_properties = config.material_properties
         self.resolution = config.texture_config.resolution
         self.seamless = config.texture_config.seamless
+        self.seamless_threshold = config.texture_config.seamless_threshold
     
     @property
     @abstractmethod
@@ -52,10 +57,7 @@ class TextureGenerator(ABC):
         """
         # Ensure correct resolution
         if image.size != (self.resolution.width, self.resolution.height):
-            image = image.resize(
-                (self.resolution.width, self.resolution.height),
-                Image.Resampling.LANCZOS
-            )
+            image = self._resize_to_resolution(image)
         
         # Convert to appropriate mode if needed
         if self.texture_type == TextureType.NORMAL:
@@ -64,9 +66,31 @@ class TextureGenerator(ABC):
         
         return image
     
+    def _resize_to_resolution(self, image: Image.Image) -> Image.Image:
+        """Resize an image to the configured resolution with Lanczos filtering.
+        
+        Large downscales first shrink by an integer factor with Pillow's box
+        reduce and finish with Lanczos; a reducing gap of 3 keeps the result
+        visually indistinguishable from a full Lanczos pass.
+        
+        Args:
+            image: Input PIL Image
+            
+        Returns:
+            Resized PIL Image
+        """
+        return image.resize(
+            (self.resolution.width, self.resolution.height),
+            Image.Resampling.LANCZOS,
+            reducing_gap=_RESIZE_REDUCING_GAP
+        )
+    
     def make_seamless(self, image: Image.Image, blend_width: int = 64) -> Image.Image:
         """Make the texture seamless by blending edges.
         
+        Textures whose opposite edges already match within the configured
+        seamless threshold are returned unchanged.
+        
         Args:
             image: Input PIL Image
             blend_width: Width of the blending region in pixels
@@ -81,5 +105,10 @@ class TextureGenerator(ABC):
         from .tessellation import TessellationModule
         tess = TessellationModule()
         
+        # Edge validation is far cheaper than a blend pass, so check first
+        is_seamless, _ = tess.validate_tiling(image, threshold=self.seamless_threshold)
+        if is_seamless:
+            return image
+        
         # Use the frequency blend method for best results
         return tess.make_seamless(image, blend_mode='frequency', blend_width=blend_width)
\ No newline at end of file
@@ -378,8 +378,7 @@ class EmissiveModule(TextureGenerator):
         temperature = min_temp + temperature * (max_temp - min_temp)
         
         # Apply to all channels (will be colored later)
-        for i in range(3):
-            emissive[:, :, i] = temperature
+        emissive[:] = temperature[:, :, np.newaxis]
         
         return emissive
     
@@ -409,8 +408,7 @@ class EmissiveModule(TextureGenerator):
             panel_mask = variance < 0.01
             
             # Only emit in panel areas
-            for i in range(3):
-                emissive[:, :, i] *= panel_mask
+            emissive *= panel_mask[:, :, np.newaxis]
         
         # Edge fade
         edge_fade = preset.get('edge_fade', 5)
@@ -461,8 +459,7 @@ class EmissiveModule(TextureGenerator):
         pattern = pattern ** falloff
         
         # Apply to all channels
-        for i in range(3):
-            emissive[:, :, i] = pattern
+        emissive[:] = pattern[:, :, np.newaxis]
         
         return emissive
     
@@ -489,10 +486,10 @@ class EmissiveModule(TextureGenerator):
             
             # Create glowing spot
             y, x = np.ogrid[:self.resolution.height, :self.resolution.width]
-            dist = np.sqrt((x - cx)**2 + (y - cy)**2)
+            dist_sq = (x - cx)**2 + (y - cy)**2
             
-            # Gaussian falloff
-            spot = np.exp(-(dist**2) / (2 * size**2))
+            # Gaussian falloff on the squared distance, so no sqrt is needed
+            spot = np.exp(-dist_sq / (2 * size**2))
             
             # Add pulsation variation
             pulse = preset.get('pulse_variation', 0.2)
@@ -504,8 +501,7 @@ class EmissiveModule(TextureGenerator):
             color = np.clip(color, 0, 1)
             
             # Add to emissive
-            for i in range(3):
-                emissive[:, :, i] += spot * intensity * color[i]
+            emissive += (spot * intensity)[:, :, np.newaxis] * color
         
         return np.clip(emissive, 0, 1)
     
@@ -548,8 +544,7 @@ class EmissiveModule(TextureGenerator):
         flame_shape = flame_shape * (0.7 + flicker * 0.3)
         
         # Apply to all channels (will be colored later)
-        for i in range(3):
-            emissive[:, :, i] = flame_shape
+        emissive[:] = flame_shape[:, :, np.newaxis]
         
         return emissive
     
@@ -642,8 +637,7 @@ class EmissiveModule(TextureGenerator):
         else:
             # Procedural crystal pattern
             pattern = self._generate_crystal_pattern()
-            for i in range(3):
-                emissive[:, :, i] = pattern
+            emissive[:] = pattern[:, :, np.newaxis]
         
         return np.clip(emissive, 0, 1)
     
@@ -674,8 +668,7 @@ class EmissiveModule(TextureGenerator):
         glow = glow * (0.7 + pulse * 0.3)
         
         # Apply to all channels
-        for i in range(3):
-            emissive[:, :, i] = glow
+        emissive[:] = glow[:, :, np.newaxis]
         
         return emissive
     
@@ -733,8 +726,7 @@ class EmissiveModule(TextureGenerator):
         
         # Apply configured emission color as tint
         if hasattr(self, 'emission_color') and self.emission_color != (1.0, 1.0, 1.0):
-            for i in range(3):
-                emissive[:, :, i] *= self.emission_color[i]
+            emissive *= np.asarray(self.emission_color[:3], dtype=emissive.dtype)
         
         return emissive
     
@@ -810,10 +802,7 @@ class EmissiveModule(TextureGenerator):
         """
         if isinstance(image, Image.Image):
             if image.size != (self.resolution.width, self.resolution.height):
-                image = image.resize(
-                    (self.resolution.width, self.resolution.height),
-                    Image.Resampling.LANCZOS
-                )
+                image = self._resize_to_resolution(image)
             
             if grayscale and image.mode != 'L':
                 image = image.convert('L')
@@ -1034,19 +1023,13 @@ class EmissiveModule(TextureGenerator):
     
     def _apply_toxic_color(self, intensity: np.ndarray) -> np.ndarray:
         """Apply toxic/radioactive green coloring."""
-        rgb = np.zeros((*intensity.shape[:2], 3))
-        
         if len(intensity.shape) == 3:
             intensity = intensity[:, :, 0]
         
-        for i in range(intensity.shape[0]):
-            for j in range(intensity.shape[1]):
-                val = intensity[i, j]
-                
-                # Toxic green
-                rgb[i, j] = [val * 0.2, val, val * 0.1]
-        
-        return rgb
+        # Toxic green, multiplied at the intensity's precision and returned
+        # as float64 like the other colour gradients
+        toxic_green = np.array([0.2, 1.0, 0.1], dtype=intensity.dtype)
+        return (intensity[:, :, np.newaxis] * toxic_green).astype(np.float64)
     
     def _apply_prismatic_color(self, intensity: np.ndarray) -> np.ndarray:
         """Apply prismatic/rainbow coloring."""
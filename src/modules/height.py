@@ -134,10 +134,7 @@ class HeightModule(TextureGenerator):
         """
         # Ensure correct size
         if diffuse_map.size != (self.resolution.width, self.resolution.height):
-            diffuse_map = diffuse_map.resize(
-                (self.resolution.width, self.resolution.height),
-                Image.Resampling.LANCZOS
-            )
+            diffuse_map = self._resize_to_resolution(diffuse_map)
         
         # Convert to RGB if needed
         if diffuse_map.mode != 'RGB':
@@ -499,10 +499,7 @@ class MetallicModule(TextureGenerator):
                 height_input = height_input.convert('L')
             
             if height_input.size != (self.resolution.width, self.resolution.height):
-                height_input = height_input.resize(
-                    (self.resolution.width, self.resolution.height),
-                    Image.Resampling.LANCZOS
-                )
+                height_input = self._resize_to_resolution(height_input)
             
             height_array = np.array(height_input, dtype=np.float32) / 255.0
         elif isinstance(height_input, np.ndarray):
@@ -525,10 +522,7 @@ class MetallicModule(TextureGenerator):
         """
         if isinstance(diffuse_map, Image.Image):
             if diffuse_map.size != (self.resolution.width, self.resolution.height):
-                diffuse_map = diffuse_map.resize(
-                    (self.resolution.width, self.resolution.height),
-                    Image.Resampling.LANCZOS
-                )
+                diffuse_map = self._resize_to_resolution(diffuse_map)
             
             if diffuse_map.mode != 'RGB':
                 diffuse_map = diffuse_map.convert('RGB')
@@ -65,23 +65,26 @@ class NormalModule(TextureGenerator):
         if invert_height:
             height_map = 1.0 - height_map
         
+        # Detail enhancement works on float normals; otherwise have the
+        # filter encode 8-bit RGB directly
+        enhance = strength > 1.5
+        
         # Convert height to normal
         normal_array = height_to_normal(
             height_map,
             strength=strength,
             invert_y=False,  # Use standard tangent space
-            blur_radius=blur_radius
+            blur_radius=blur_radius,
+            out_dtype=None if enhance else np.uint8
         )
         
         # Optional: Enhance details for more pronounced normals
-        if strength > 1.5:
+        if enhance:
             normal_array = self._enhance_normal_details(normal_array)
+            normal_array = (normal_array * 255).astype(np.uint8)
         
         # Convert to PIL Image
-        normal_image = Image.fromarray(
-            (normal_array * 255).astype(np.uint8),
-            mode='RGB'
-        )
+        normal_image = Image.fromarray(normal_array, mode='RGB')
         
         # Apply post-processing
         normal_image = self.process_image(normal_image)
@@ -109,10 +112,7 @@ class NormalModule(TextureGenerator):
             
             # Resize if needed
             if height_input.size != (self.resolution.width, self.resolution.height):
-                height_input = height_input.resize(
-                    (self.resolution.width, self.resolution.height),
-                    Image.Resampling.LANCZOS
-                )
+                height_input = self._resize_to_resolution(height_input)
             
             height_array = np.array(height_input, dtype=np.float32) / 255.0
         elif isinstance(height_input, np.ndarray):
@@ -139,10 +139,7 @@ class NormalModule(TextureGenerator):
         if isinstance(diffuse_map, Image.Image):
             # Resize if needed
             if diffuse_map.size != (self.resolution.width, self.resolution.height):
-                diffuse_map = diffuse_map.resize(
-                    (self.resolution.width, self.resolution.height),
-                    Image.Resampling.LANCZOS
-                )
+                diffuse_map = self._resize_to_resolution(diffuse_map)
             diffuse_array = np.array(diffuse_map, dtype=np.float32) / 255.0
         else:
             diffuse_array = diffuse_map.astype(np.float32)
@@ -269,7 +269,7 @@ class RoughnessModule:
         grad_y = sobel(height_array, axis=1)
         
         # Magnitude of gradients indicates rate of change
-        gradient_magnitude = np.sqrt(grad_x**2 + grad_y**2)
+        gradient_magnitude = np.hypot(grad_x, grad_y)
         
         # Normalize and map to roughness
         gradient_magnitude = gradient_magnitude / gradient_magnitude.max()
@@ -165,11 +165,9 @@ class TessellationModule:
         """
         arr = np.array(image, dtype=np.float32)
         if len(arr.shape) == 3:
-            # Process each channel separately
-            channels = []
-            for c in range(arr.shape[2]):
-                channels.append(self._frequency_blend_channel(arr[:, :, c]))
-            result = np.stack(channels, axis=2)
+            # All channels go through one batched 2-D FFT; each channel is
+            # still filtered and normalized independently
+            result = self._frequency_blend_channel(arr)
             return Image.fromarray(result.astype(np.uint8), 
                                  'RGB' if arr.shape[2] == 3 else 'RGBA')
         else:
@@ -178,22 +176,30 @@ class TessellationModule:
             return Image.fromarray(result.astype(np.uint8), 'L')
     
     def _frequency_blend_channel(self, channel: np.ndarray) -> np.ndarray:
-        """Apply frequency domain blending to a single channel."""
-        h, w = channel.shape
+        """Apply frequency domain blending to a single channel.
+        
+        A (H, W, C) array is treated as C independent channels stacked on
+        the last axis and transformed together.
+        """
+        h, w = channel.shape[:2]
+        spatial = (0, 1)
+        # Broadcast 2-D filters over any trailing channel axis
+        channel_axes = (1,) * (channel.ndim - 2)
         
         # Apply window function to reduce edge artifacts
         window_x = np.hanning(w)
         window_y = np.hanning(h)
-        window = window_y[:, np.newaxis] * window_x[np.newaxis, :]
+        window = (window_y[:, np.newaxis] * window_x[np.newaxis, :]).reshape((h, w) + channel_axes)
         
         # Blend edges with center
-        windowed = channel * window + np.mean(channel) * (1 - window)
+        mean = np.mean(channel, axis=spatial, keepdims=True)
+        windowed = channel * window + mean * (1 - window)
         
         # Apply FFT
-        fft = np.fft.fft2(windowed)
+        fft = np.fft.fft2(windowed, axes=spatial)
         
         # Shift zero frequency to center
-        fft_shifted = np.fft.fftshift(fft)
+        fft_shifted = np.fft.fftshift(fft, axes=spatial)
         
         # Create high-pass filter to preserve details
         y, x = np.ogrid[-h/2:h/2, -w/2:w/2]
@@ -202,14 +208,16 @@ class TessellationModule:
         highpass = 1 - np.exp(-(x*x + y*y) / (2 * sigma * sigma))
         
         # Apply filter
-        fft_filtered = fft_shifted * highpass
+        fft_filtered = fft_shifted * highpass.reshape((h, w) + channel_axes)
         
         # Inverse transform
-        fft_ishifted = np.fft.ifftshift(fft_filtered)
-        result = np.fft.ifft2(fft_ishifted).real
+        fft_ishifted = np.fft.ifftshift(fft_filtered, axes=spatial)
+        result = np.fft.ifft2(fft_ishifted, axes=spatial).real
         
         # Normalize
-        result = (result - result.min()) / (result.max() - result.min()) * 255
+        result_min = result.min(axis=spatial, keepdims=True)
+        result_max = result.max(axis=spatial, keepdims=True)
+        result = (result - result_min) / (result_max - result_min) * 255
         
         return result
     
@@ -142,6 +142,7 @@ class TextureConfig:
     types: List[TextureType]
     seamless: bool = True
     bit_depth: int = 8
+    seamless_threshold: float = 0.1
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TextureConfig":
@@ -158,7 +159,8 @@ class TextureConfig:
             format=format_enum,
             types=types,
             seamless=data.get("seamless", True),
-            bit_depth=data.get("bit_depth", 8)
+            bit_depth=data.get("bit_depth", 8),
+            seamless_threshold=data.get("seamless_threshold", 0.1)
         )
 
 
@@ -177,6 +179,9 @@ class Config:
     create_preview: bool = True
     api_key: Optional[str] = None
     org_id: Optional[str] = None
+    png_compress_level: int = 1
+    cache_directory: Optional[str] = None
+    cache_ttl: float = 3600.0
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Config":
@@ -209,6 +214,11 @@ class Config:
             generation=generation_config
         )
 
+        # Image cache for repeated identical API requests
+        cache_data = data.get("cache", {})
+        cache_directory = cache_data.get("directory", ".cache") if cache_data.get("enabled", False) else None
+        cache_ttl = cache_data.get("ttl", 3600.0)
+        
         # Handle different config formats
         if "project" in data:
             # Standard format
@@ -218,6 +228,7 @@ class Config:
             output_dir = data["output"]["directory"]
             naming_convention = data["output"]["naming_convention"]
             create_preview = data["output"].get("create_preview", True)
+            png_compress_level = data["output"].get("compress_level", 1)
             api_key = data.get("api", {}).get("openai_key")
             org_id = data.get("api", {}).get("openai_org_id")
         else:
@@ -228,6 +239,7 @@ class Config:
             output_dir = data.get("output", {}).get("directory", "output")
             naming_convention = data.get("output", {}).get("prefix", project_name)
             create_preview = data.get("output", {}).get("create_preview", True)
+            png_compress_level = data.get("output", {}).get("compress_level", 1)
             # Support both api_key formats
             api_key = data.get("api", {}).get("api_key") or data.get("api", {}).get("openai_key")
             org_id = data.get("api", {}).get("org_id") or data.get("api", {}).get("openai_org_id")
@@ -244,5 +256,8 @@ class Config:
             naming_convention=naming_convention,
             create_preview=create_preview,
             api_key=api_key,
-            org_id=org_id
+            org_id=org_id,
+            png_compress_level=png_compress_level,
+            cache_directory=cache_directory,
+            cache_ttl=cache_ttl
         )
\ No newline at end of file
@@ -1,18 +1,35 @@
 """File handling utilities."""
 
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 from PIL import Image
 import io
 
 
-def save_texture(image_data: bytes, file_path: str) -> bool:
+# zlib level for PNG output. Level 1 encodes several times faster than
+# Pillow's default of 6 for a modest size increase, which suits textures
+# that are re-encoded by the engine that imports them anyway.
+DEFAULT_PNG_COMPRESS_LEVEL = 1
+
+
+def save_image(image: Image.Image, file_path: Union[str, Path],
+               compress_level: int = DEFAULT_PNG_COMPRESS_LEVEL) -> None:
+    """Save an image, applying the PNG compression level to PNG files."""
+    path = Path(file_path)
+    if path.suffix.lower() == '.png':
+        image.save(path, compress_level=compress_level, optimize=False)
+    else:
+        image.save(path)
+
+
+def save_texture(image_data: bytes, file_path: str,
+                 compress_level: int = DEFAULT_PNG_COMPRESS_LEVEL) -> bool:
     """Save texture to file."""
     try:
         image = Image.open(io.BytesIO(image_data))
         path = Path(file_path)
         ensure_directory(path.parent)
-        image.save(path)
+        save_image(image, path, compress_level)
         return True
     except Exception as e:
         print(f"Error saving image to {file_path}: {e}")
@@ -1,8 +1,35 @@
 """Image filtering utilities for texture processing."""
 
 import numpy as np
+from numpy.typing import DTypeLike
 from scipy import ndimage
-from typing import Tuple
+from typing import Optional, Tuple
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import cv2
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+
+
+# Images at or below this many pixels stay on the scipy path, where the
+# numba dispatch overhead isn't worth paying
+_NUMBA_MIN_PIXELS = 256 * 256
+
+# Wide blurs on large maps switch from the separable spatial filter
+# (8 * sigma + 1 taps per axis) to an FFT convolution of the padded image
+_FFT_MIN_SIGMA = 12.0
+_FFT_MIN_PIXELS = 1024 * 1024
+
+# 1-D factors of the 3x3 Sobel kernel
+_SOBEL_SMOOTH = np.array([1.0, 2.0, 1.0], dtype=np.float32)
+_SOBEL_DIFF = np.array([1.0, 0.0, -1.0], dtype=np.float32)
 
 
 def sobel_filter(image: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
@@ -14,31 +41,78 @@ def sobel_filter(image: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     Returns:
         Tuple of (gradient_x, gradient_y) arrays
     """
-    # Sobel kernels
-    sobel_x = np.array([
-        [-1, 0, 1],
-        [-2, 0, 2],
-        [-1, 0, 1]
-    ], dtype=np.float32)
-    
-    sobel_y = np.array([
-        [-1, -2, -1],
-        [ 0,  0,  0],
-        [ 1,  2,  1]
-    ], dtype=np.float32)
-    
-    # Apply filters
-    grad_x = ndimage.convolve(image, sobel_x)
-    grad_y = ndimage.convolve(image, sobel_y)
+    # Separable Sobel on a contiguous float32 buffer keeps scipy on its
+    # fast path without upcasting to float64
+    image = np.ascontiguousarray(image, dtype=np.float32)
+    
+    # OpenCV's SIMD Sobel gives the same result when the sign is flipped with
+    # scale=-1 and the border reflects like scipy's 'reflect' mode
+    if CV2_AVAILABLE and image.ndim == 2:
+        grad_x = cv2.Sobel(image, cv2.CV_32F, 1, 0, ksize=3, scale=-1,
+                           borderType=cv2.BORDER_REFLECT)
+        grad_y = cv2.Sobel(image, cv2.CV_32F, 0, 1, ksize=3, scale=-1,
+                           borderType=cv2.BORDER_REFLECT)
+        return grad_x, grad_y
+    
+    # Sobel is separable: a [1, 2, 1] smoothing pass across the gradient
+    # direction and a [1, 0, -1] difference along it. The difference weights
+    # are oriented to give left - right and top - bottom directly.
+    grad_x = ndimage.correlate1d(image, _SOBEL_SMOOTH, axis=0, mode='reflect')
+    ndimage.correlate1d(grad_x, _SOBEL_DIFF, axis=1, output=grad_x, mode='reflect')
+    grad_y = ndimage.correlate1d(image, _SOBEL_SMOOTH, axis=1, mode='reflect')
+    ndimage.correlate1d(grad_y, _SOBEL_DIFF, axis=0, output=grad_y, mode='reflect')
     
     return grad_x, grad_y
 
 
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _height_to_normal_numba(height_map, strength, invert_y, scale, out):
+        """Fused Sobel + normalize kernel writing RGB-encoded normals into out.
+        
+        Matches sobel_filter followed by the normal construction in
+        height_to_normal, with edge pixels replicated at the borders.
+        Encoded values are multiplied by scale, so a uint8 out buffer with
+        scale=255 receives 8-bit normals directly. Requires strength > 0.
+        """
+        height, width = height_map.shape
+        y_sign = -1.0 if invert_y else 1.0
+        # normalize(-gx*s, -gy*s, 1) == normalize(-gx, -gy, 1/s) for s > 0
+        nz = 1.0 / strength
+        nz_sq = nz * nz
+        half_scale = 0.5 * scale
+        for i in prange(height):
+            up = max(i - 1, 0)
+            down = min(i + 1, height - 1)
+            for j in range(width):
+                left = max(j - 1, 0)
+                right = min(j + 1, width - 1)
+                
+                tl = height_map[up, left]
+                tc = height_map[up, j]
+                tr = height_map[up, right]
+                ml = height_map[i, left]
+                mr = height_map[i, right]
+                bl = height_map[down, left]
+                bc = height_map[down, j]
+                br = height_map[down, right]
+                
+                grad_x = (tl + 2.0 * ml + bl) - (tr + 2.0 * mr + br)
+                grad_y = ((tl + 2.0 * tc + tr) - (bl + 2.0 * bc + br)) * y_sign
+                
+                inv_mag = 1.0 / np.sqrt(grad_x * grad_x + grad_y * grad_y + nz_sq)
+                # Clamp so fastmath rounding can't push 8-bit values past 255
+                out[i, j, 0] = min((1.0 - grad_x * inv_mag) * half_scale, scale)
+                out[i, j, 1] = min((1.0 - grad_y * inv_mag) * half_scale, scale)
+                out[i, j, 2] = min((1.0 + nz * inv_mag) * half_scale, scale)
+
+
 def height_to_normal(
     height_map: np.ndarray, 
     strength: float = 1.0,
     invert_y: bool = False,
-    blur_radius: float = 0.0
+    blur_radius: float = 0.0,
+    out_dtype: Optional[DTypeLike] = None
 ) -> np.ndarray:
     """Convert height map to normal map using gradient calculation.
     
@@ -47,10 +121,14 @@ def height_to_normal(
         strength: Normal strength factor (higher = more pronounced normals)
         invert_y: Whether to invert Y axis (for different coordinate systems)
         blur_radius: Blur radius to apply before normal calculation (0 = no blur)
+        out_dtype: Pass 'uint8' to get the 8-bit encoding (values 0-255,
+            truncated) written directly, without a float RGB intermediate
         
     Returns:
-        Normal map as 3D numpy array (RGB, values 0-1)
+        Normal map as 3D numpy array (RGB, values 0-1, or 0-255 for uint8)
     """
+    to_uint8 = out_dtype is not None and np.dtype(out_dtype) == np.uint8
+    
     # Ensure height map is normalized
     if height_map.max() > 1.0:
         height_map = height_map / 255.0
@@ -59,6 +137,21 @@ def height_to_normal(
     if blur_radius > 0:
         height_map = gaussian_blur(height_map, sigma=blur_radius)
     
+    # Large float maps go through the fused numba kernel when available
+    if (NUMBA_AVAILABLE and strength > 0 and height_map.ndim == 2
+            and height_map.dtype.kind == 'f'
+            and height_map.size > _NUMBA_MIN_PIXELS):
+        if to_uint8:
+            normal_map = np.empty(height_map.shape + (3,), dtype=np.uint8)
+            scale = 255.0
+        else:
+            normal_map = np.empty(height_map.shape + (3,), dtype=height_map.dtype)
+            scale = 1.0
+        _height_to_normal_numba(
+            np.ascontiguousarray(height_map), strength, invert_y, scale, normal_map
+        )
+        return normal_map
+    
     # Apply Sobel filter to get gradients
     grad_x, grad_y = sobel_filter(height_map)
     
@@ -82,6 +175,14 @@ def height_to_normal(
     normal_y /= magnitude
     normal_z /= magnitude
     
+    # 8-bit output is encoded straight into the uint8 buffer; the float to
+    # uint8 assignment truncates like astype(np.uint8)
+    if to_uint8:
+        normal_map = np.empty(height_map.shape + (3,), dtype=np.uint8)
+        for channel, component in enumerate((normal_x, normal_y, normal_z)):
+            normal_map[..., channel] = (component + 1.0) * 0.5 * 255
+        return normal_map
+    
     # Convert from [-1, 1] to [0, 1] range for RGB encoding
     normal_map = np.stack([
         (normal_x + 1.0) * 0.5,  # R channel
@@ -102,9 +203,53 @@ def gaussian_blur(image: np.ndarray, sigma: float = 1.0) -> np.ndarray:
     Returns:
         Blurred image as numpy array
     """
+    # OpenCV's separable blur matches gaussian_filter on 2-D float maps when
+    # given the same truncated kernel width and boundary mode
+    if (CV2_AVAILABLE and sigma > 0 and image.ndim == 2
+            and image.dtype in (np.float32, np.float64)):
+        ksize = 2 * int(4.0 * sigma + 0.5) + 1
+        return cv2.GaussianBlur(
+            np.ascontiguousarray(image), (ksize, ksize), sigma, sigmaY=sigma,
+            borderType=cv2.BORDER_REFLECT
+        )
+    
+    # Otherwise wide kernels on large 2-D float maps are cheaper in the
+    # frequency domain
+    if (sigma >= _FFT_MIN_SIGMA and image.ndim == 2 and image.dtype.kind == 'f'
+            and image.size >= _FFT_MIN_PIXELS):
+        return _gaussian_blur_fft(image, sigma)
     return ndimage.gaussian_filter(image, sigma=sigma)
 
 
+def _gaussian_blur_fft(image: np.ndarray, sigma: float, truncate: float = 4.0) -> np.ndarray:
+    """Gaussian blur a 2-D image by FFT convolution.
+    
+    Matches ndimage.gaussian_filter with its default truncate and 'reflect'
+    boundary mode, to within floating point rounding.
+    
+    Args:
+        image: Input image as 2D float numpy array
+        sigma: Standard deviation for Gaussian kernel
+        truncate: Truncate the kernel at this many standard deviations
+        
+    Returns:
+        Blurred image with the same shape and dtype as the input
+    """
+    # scipy.signal takes longer to import than the rest of this module's
+    # dependencies combined and only this path needs it
+    from scipy.signal import fftconvolve
+    
+    radius = int(truncate * sigma + 0.5)
+    taps = np.arange(-radius, radius + 1, dtype=np.float64)
+    kernel = np.exp(-0.5 * (taps / sigma) ** 2)
+    kernel /= kernel.sum()
+    
+    # numpy's 'symmetric' padding is scipy's 'reflect' boundary mode
+    padded = np.pad(image, radius, mode='symmetric')
+    blurred = fftconvolve(padded, np.outer(kernel, kernel), mode='valid')
+    return blurred.astype(image.dtype, copy=False)
+
+
 def enhance_details(
     image: np.ndarray, 
     detail_strength: float = 0.5,
@@ -92,10 +92,15 @@ class ProgressLogger:
         self.start_times[task_name] = time.time()
         if total_steps:
             self.step_counts[task_name] = total_steps
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         self.logger.info(f"{Colors.BRIGHT_GREEN}▶ Starting: {task_name}{Colors.RESET}")
         
     def update_progress(self, task_name: str, message: str, current_step: Optional[int] = None):
         """Update progress for a task."""
+        # Skip the timing math and message formatting when INFO is filtered out
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         elapsed = time.time() - self.start_times.get(task_name, time.time())
         elapsed_str = f"[{elapsed:.1f}s]"
         
@@ -108,21 +113,21 @@ class ProgressLogger:
     def complete_progress(self, task_name: str, message: Optional[str] = None):
         """Mark a task as complete."""
         if task_name in self.start_times:
-            elapsed = time.time() - self.start_times[task_name]
-            complete_msg = message or f"Completed: {task_name}"
-            self.logger.info(f"{Colors.BRIGHT_GREEN}✓ {complete_msg} [{elapsed:.1f}s]{Colors.RESET}")
-            del self.start_times[task_name]
-            if task_name in self.step_counts:
-                del self.step_counts[task_name]
+            start_time = self.start_times.pop(task_name)
+            self.step_counts.pop(task_name, None)
+            if self.logger.isEnabledFor(logging.INFO):
+                elapsed = time.time() - start_time
+                complete_msg = message or f"Completed: {task_name}"
+                self.logger.info(f"{Colors.BRIGHT_GREEN}✓ {complete_msg} [{elapsed:.1f}s]{Colors.RESET}")
                 
     def error_progress(self, task_name: str, error_message: str):
         """Mark a task as failed."""
         if task_name in self.start_times:
-            elapsed = time.time() - self.start_times[task_name]
-            self.logger.error(f"{Colors.BRIGHT_RED}✗ Failed: {task_name} - {error_message} [{elapsed:.1f}s]{Colors.RESET}")
-            del self.start_times[task_name]
-            if task_name in self.step_counts:
-                del self.step_counts[task_name]
+            start_time = self.start_times.pop(task_name)
+            self.step_counts.pop(task_name, None)
+            if self.logger.isEnabledFor(logging.ERROR):
+                elapsed = time.time() - start_time
+                self.logger.error(f"{Colors.BRIGHT_RED}✗ Failed: {task_name} - {error_message} [{elapsed:.1f}s]{Colors.RESET}")
 
 
 _loggers = {}
@@ -1,14 +1,100 @@
 """Preview generation for PBR materials using simple 3D rendering."""
 
+import io
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple, Union
 import math
+from ..utils.file_handlers import DEFAULT_PNG_COMPRESS_LEVEL
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Scale for converting 8-bit texels to float32 in [0, 1]
+_INV_255 = np.float32(1 / 255)
+
+# truetype() returns a FreeTypeFont; the bitmap fallback is an ImageFont
+_Font = Union[ImageFont.FreeTypeFont, ImageFont.ImageFont]
+
+
+@lru_cache(maxsize=8)
+def _load_fonts(font_size: int) -> Tuple[_Font, _Font]:
+    """Load the title and label fonts for the preview overlay.
+    
+    Fonts are cached per size so batch previews parse the font file once.
+    
+    Args:
+        font_size: Point size of the title font
+        
+    Returns:
+        Tuple of (font, small_font)
+    """
+    # Try to use a nice font, fall back to default if not available
+    font: _Font
+    small_font: _Font
+    try:
+        font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", font_size)
+        small_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", font_size - 2)
+    except (OSError, ImportError):
+        font = ImageFont.load_default()
+        small_font = font
+    return font, small_font
+
+
+@lru_cache(maxsize=8)
+def _sphere_geometry(
+    width: int, height: int
+) -> Tuple[np.ndarray, Tuple[np.ndarray, np.ndarray, np.ndarray], np.ndarray, np.ndarray]:
+    """Compute the sphere hit mask, surface normals and UVs for a preview size.
+    
+    The geometry is independent of the material, so it is computed once per
+    preview size and reused; only the shading runs per material.
+    
+    Args:
+        width: Width of the preview image
+        height: Height of the preview image
+        
+    Returns:
+        Tuple of (mask, normal, u, v) read-only arrays, where mask marks the
+        sphere pixels, normal is an (x, y, z) tuple of component arrays and
+        all per-pixel arrays cover only the sphere pixels
+    """
+    # Sphere parameters
+    center_x, center_y = width // 2, height // 2
+    radius = np.float32(min(width, height) * 0.35)
+    
+    # Ray from every pixel towards the sphere center
+    yy, xx = np.mgrid[0:height, 0:width].astype(np.float32)
+    dx = xx - center_x
+    dy = yy - center_y
+    
+    # Pixels whose ray hits the sphere. Only these are shaded; everything
+    # below works on the flat list of sphere pixels.
+    dist_sq = dx * dx + dy * dy
+    mask = dist_sq <= radius * radius
+    dx = dx[mask]
+    dy = dy[mask]
+    dist_sq = dist_sq[mask]
+    
+    # Z coordinate on sphere surface
+    z = np.sqrt(np.maximum(radius * radius - dist_sq, 0))
+    
+    # Surface normals, kept as separate x/y/z arrays so dot products are
+    # plain elementwise arithmetic rather than reductions over an RGB axis
+    inv_length = 1.0 / np.sqrt(dist_sq + z * z)
+    normal = (dx * inv_length, dy * inv_length, z * inv_length)
+    
+    # UV coordinates for texture mapping
+    u = 0.5 + np.arctan2(dx, z) / (2 * math.pi)
+    v = 0.5 - np.arcsin(np.clip(dy / radius, -1.0, 1.0)) / math.pi
+    
+    for array in (mask, u, v) + normal:
+        array.flags.writeable = False
+    return mask, normal, u, v
+
 
 class PBRPreviewGenerator:
     """Generate preview images for PBR materials using simple raytracing."""
@@ -52,8 +138,9 @@ class PBRPreviewGenerator:
             # Add material information
             preview = self._add_material_info(preview, material_name, textures)
             
-            # Save the preview
-            preview.save(output_path)
+            # Save the preview: encode in memory, then hand the file a
+            # single write instead of Pillow's chunked writes
+            self._write_image(preview, Path(output_path))
             logger.info(f"Preview saved to: {output_path}")
             
             return True
@@ -62,32 +149,69 @@ class PBRPreviewGenerator:
             logger.error(f"Error generating preview: {e}")
             return False
     
+    @staticmethod
+    def _write_image(image: Image.Image, path: Path) -> None:
+        """Encode an image in memory and write it to disk in one call.
+        
+        Args:
+            image: Image to write
+            path: Destination path; the format follows its extension
+        """
+        buffer = io.BytesIO()
+        if path.suffix.lower() == '.png':
+            image.save(buffer, format='PNG', compress_level=DEFAULT_PNG_COMPRESS_LEVEL)
+        else:
+            image.save(buffer, format=Image.registered_extensions()[path.suffix.lower()])
+        path.write_bytes(buffer.getbuffer())
+        
     def _load_textures(self, texture_paths: Dict[str, str]) -> Dict[str, Optional[Image.Image]]:
         """Load texture images from file paths.
         
+        Textures are decoded on a thread pool; PIL releases the GIL while
+        decompressing, so the files load concurrently.
+        
         Args:
             texture_paths: Dictionary mapping texture types to file paths
             
         Returns:
             Dictionary mapping texture types to PIL Images
         """
-        loaded = {}
-        
-        for tex_type, path in texture_paths.items():
-            if path and Path(path).exists():
-                try:
-                    img = Image.open(path).convert('RGB')
-                    # Resize to preview resolution for performance
-                    img = img.resize((self.width, self.height), Image.Resampling.LANCZOS)
-                    loaded[tex_type] = img
-                    logger.debug(f"Loaded {tex_type} texture from {path}")
-                except Exception as e:
-                    logger.error(f"Error loading {tex_type} texture: {e}")
-                    loaded[tex_type] = None
-            else:
-                loaded[tex_type] = None
-                
-        return loaded
+        if not texture_paths:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=len(texture_paths)) as executor:
+            images = executor.map(self._load_texture, texture_paths.keys(), texture_paths.values())
+            return dict(zip(texture_paths.keys(), images))
+    
+    def _load_texture(self, tex_type: str, path: Optional[str]) -> Optional[Image.Image]:
+        """Load a single texture image.
+        
+        Textures larger than the preview are downscaled to the preview size
+        so the nearest-neighbour sampling in the renderer does not alias.
+        Textures that already fit are kept at native resolution.
+        
+        Args:
+            tex_type: Texture type, used for logging
+            path: Path to the texture file
+            
+        Returns:
+            RGB PIL Image, or None if the file is missing or unreadable
+        """
+        if not (path and Path(path).exists()):
+            return None
+        
+        try:
+            img = Image.open(path).convert('RGB')
+            if img.width > self.width or img.height > self.height:
+                # Filtered downscale; reducing_gap lets PIL box-reduce large
+                # textures before the LANCZOS pass
+                img = img.resize((self.width, self.height), Image.Resampling.LANCZOS,
+                                 reducing_gap=3.0)
+            logger.debug(f"Loaded {tex_type} texture from {path}")
+            return img
+        except Exception as e:
+            logger.error(f"Error loading {tex_type} texture: {e}")
+            return None
     
     def _render_sphere_preview(self, textures: Dict[str, Optional[Image.Image]]) -> Image.Image:
         """Render a sphere with the PBR material applied.
@@ -105,10 +229,6 @@ class PBRPreviewGenerator:
         Returns:
             Rendered preview image
         """
-        # Create output image
-        output = Image.new('RGB', (self.width, self.height), (50, 50, 50))
-        pixels = output.load()
-        
         # Get texture data as numpy arrays for faster access
         diffuse_data = np.array(textures.get('diffuse', None)) if textures.get('diffuse') else None
         normal_data = np.array(textures.get('normal', None)) if textures.get('normal') else None
@@ -116,114 +236,113 @@ class PBRPreviewGenerator:
         metallic_data = np.array(textures.get('metallic', None)) if textures.get('metallic') else None
         ao_data = np.array(textures.get('ao', None)) if textures.get('ao') else None
         
-        # Sphere parameters
-        center_x, center_y = self.width // 2, self.height // 2
-        radius = min(self.width, self.height) * 0.35
-        
-        # Lighting setup
-        light_dir = np.array([0.5, -0.5, -0.7])
+        # Lighting setup. Everything is float32 so the shading math stays
+        # in single precision instead of promoting to float64.
+        light_dir = np.array([0.5, -0.5, -0.7], dtype=np.float32)
         light_dir = light_dir / np.linalg.norm(light_dir)
-        light_color = np.array([1.0, 1.0, 1.0])
-        ambient_light = np.array([0.1, 0.1, 0.1])
+        light_color = np.array([1.0, 1.0, 1.0], dtype=np.float32)
+        ambient_light = np.array([0.1, 0.1, 0.1], dtype=np.float32)
         
         # Camera/view direction
-        view_dir = np.array([0, 0, -1])
-        
-        # Render each pixel
-        for y in range(self.height):
-            for x in range(self.width):
-                # Calculate ray from pixel to sphere center
-                dx = x - center_x
-                dy = y - center_y
-                
-                # Check if ray hits sphere
-                dist_sq = dx * dx + dy * dy
-                if dist_sq <= radius * radius:
-                    # Calculate Z coordinate on sphere surface
-                    z = math.sqrt(radius * radius - dist_sq)
-                    
-                    # Calculate normal at this point
-                    normal = np.array([dx, dy, z])
-                    normal = normal / np.linalg.norm(normal)
-                    
-                    # Calculate UV coordinates for texture mapping
-                    u = 0.5 + math.atan2(dx, z) / (2 * math.pi)
-                    v = 0.5 - math.asin(dy / radius) / math.pi
-                    
-                    # Sample textures at UV coordinates
-                    tex_x = int(u * (self.width - 1))
-                    tex_y = int(v * (self.height - 1))
-                    
-                    # Get diffuse color
-                    if diffuse_data is not None:
-                        diffuse_color = diffuse_data[tex_y, tex_x] / 255.0
-                    else:
-                        diffuse_color = np.array([0.5, 0.5, 0.5])
-                    
-                    # Apply normal mapping
-                    if normal_data is not None:
-                        normal_sample = normal_data[tex_y, tex_x] / 255.0
-                        # Convert from [0,1] to [-1,1]
-                        normal_sample = normal_sample * 2.0 - 1.0
-                        # Perturb the surface normal
-                        normal = self._apply_normal_map(normal, normal_sample)
-                    
-                    # Get material properties
-                    if roughness_data is not None:
-                        roughness = roughness_data[tex_y, tex_x, 0] / 255.0
-                    else:
-                        roughness = 0.5
-                        
-                    if metallic_data is not None:
-                        metallic = metallic_data[tex_y, tex_x, 0] / 255.0
-                    else:
-                        metallic = 0.0
-                        
-                    if ao_data is not None:
-                        ao = ao_data[tex_y, tex_x, 0] / 255.0
-                    else:
-                        ao = 1.0
-                    
-                    # Calculate lighting
-                    color = self._calculate_pbr_lighting(
-                        normal, view_dir, light_dir, light_color,
-                        diffuse_color, roughness, metallic, ao, ambient_light
-                    )
-                    
-                    # Convert to 8-bit color
-                    color = np.clip(color * 255, 0, 255).astype(int)
-                    pixels[x, y] = tuple(color)
-        
-        return output
+        view_dir = np.array([0, 0, -1], dtype=np.float32)
+        
+        # Sphere coverage, normals and UVs depend only on the preview size
+        mask, normal, u, v = _sphere_geometry(self.width, self.height)
+        
+        # Get diffuse color
+        if diffuse_data is not None:
+            diffuse_color = self._sample_texture(diffuse_data, u, v) * _INV_255
+        else:
+            diffuse_color = np.full(u.shape + (3,), 0.5, dtype=np.float32)
+        
+        # Apply normal mapping
+        if normal_data is not None:
+            normal_sample = self._sample_texture(normal_data, u, v) * _INV_255
+            # Convert from [0,1] to [-1,1]
+            normal_sample = normal_sample * 2.0 - 1.0
+            # Perturb the surface normal
+            normal = self._apply_normal_map(normal, normal_sample)
+        
+        # Get material properties
+        if roughness_data is not None:
+            roughness = self._sample_texture(roughness_data, u, v)[..., 0] * _INV_255
+        else:
+            roughness = np.full(u.shape, 0.5, dtype=np.float32)
+            
+        if metallic_data is not None:
+            metallic = self._sample_texture(metallic_data, u, v)[..., 0] * _INV_255
+        else:
+            metallic = np.zeros(u.shape, dtype=np.float32)
+            
+        if ao_data is not None:
+            ao = self._sample_texture(ao_data, u, v)[..., 0] * _INV_255
+        else:
+            ao = np.ones(u.shape, dtype=np.float32)
+        
+        # Calculate lighting
+        color = self._calculate_pbr_lighting(
+            normal, view_dir, light_dir, light_color,
+            diffuse_color, roughness, metallic, ao, ambient_light
+        )
+        
+        # Write 8-bit sphere colors over the background
+        output = np.full((self.height, self.width, 3), 50, dtype=np.uint8)
+        output[mask] = np.clip(color * 255, 0, 255).astype(np.uint8)
+        
+        return Image.fromarray(output, 'RGB')
     
-    def _apply_normal_map(self, surface_normal: np.ndarray, normal_sample: np.ndarray) -> np.ndarray:
-        """Apply normal map to surface normal.
+    @staticmethod
+    def _sample_texture(data: np.ndarray, u: np.ndarray, v: np.ndarray) -> np.ndarray:
+        """Nearest-neighbour sample a texture array at UV coordinates.
         
         Args:
-            surface_normal: Original surface normal
-            normal_sample: Normal map sample in tangent space
+            data: Texture data, shape (height, width, channels)
+            u: Horizontal texture coordinates in [0, 1]
+            v: Vertical texture coordinates in [0, 1]
             
         Returns:
-            Perturbed normal
+            Sampled texels, shape u.shape + (channels,)
+        """
+        tex_height, tex_width = data.shape[:2]
+        tex_x = (u * (tex_width - 1)).astype(np.intp)
+        tex_y = (v * (tex_height - 1)).astype(np.intp)
+        return data[tex_y, tex_x]
+    
+    def _apply_normal_map(
+        self,
+        surface_normal: Tuple[np.ndarray, np.ndarray, np.ndarray],
+        normal_sample: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Apply normal map to surface normals.
+        
+        Args:
+            surface_normal: Original surface normals as (x, y, z) component arrays
+            normal_sample: Normal map samples in tangent space, shape (..., 3)
+            
+        Returns:
+            Perturbed normals as (x, y, z) component arrays
         """
         # Simple approximation - blend the normals
         # In a full implementation, we'd calculate proper tangent space
-        perturbed = surface_normal + normal_sample * 0.5
-        return perturbed / np.linalg.norm(perturbed)
+        nx = surface_normal[0] + normal_sample[..., 0] * 0.5
+        ny = surface_normal[1] + normal_sample[..., 1] * 0.5
+        nz = surface_normal[2] + normal_sample[..., 2] * 0.5
+        inv_length = 1.0 / np.sqrt(nx * nx + ny * ny + nz * nz)
+        return nx * inv_length, ny * inv_length, nz * inv_length
     
     def _calculate_pbr_lighting(
         self,
-        normal: np.ndarray,
+        normal: Tuple[np.ndarray, np.ndarray, np.ndarray],
         view_dir: np.ndarray,
         light_dir: np.ndarray,
         light_color: np.ndarray,
         diffuse_color: np.ndarray,
-        roughness: float,
-        metallic: float,
-        ao: float,
+        roughness: np.ndarray,
+        metallic: np.ndarray,
+        ao: np.ndarray,
         ambient: np.ndarray
     ) -> np.ndarray:
-        """Calculate PBR lighting for a surface point.
+        """Calculate PBR lighting for an array of surface points.
         
         Simplified PBR lighting calculation including:
         - Diffuse (Lambert)
@@ -232,28 +351,40 @@ class PBRPreviewGenerator:
         - Metallic workflow
         
         Args:
-            normal: Surface normal
+            normal: Surface normals as (x, y, z) component arrays
             view_dir: View direction
             light_dir: Light direction
             light_color: Light color
-            diffuse_color: Base color from diffuse texture
-            roughness: Roughness value
-            metallic: Metallic value
-            ao: Ambient occlusion value
+            diffuse_color: Base colors from diffuse texture, shape (..., 3)
+            roughness: Roughness values, shape (...)
+            metallic: Metallic values, shape (...)
+            ao: Ambient occlusion values, shape (...)
             ambient: Ambient light color
             
         Returns:
-            Final color
+            Final colors, shape (..., 3)
         """
         # Calculate basic vectors
         h = (view_dir - light_dir) / np.linalg.norm(view_dir - light_dir)
-        ndotl = max(0, np.dot(normal, -light_dir))
-        ndotv = max(0, np.dot(normal, view_dir))
-        ndoth = max(0, np.dot(normal, h))
         vdoth = max(0, np.dot(view_dir, h))
         
+        # The directions are constant, so each dot product with the normal
+        # expands to three multiply-adds over the component arrays
+        nx, ny, nz = normal
+        ndotl = np.maximum(0, -(nx * light_dir[0] + ny * light_dir[1] + nz * light_dir[2]))
+        ndotv = np.maximum(0, nx * view_dir[0] + ny * view_dir[1] + nz * view_dir[2])
+        ndoth = np.maximum(0, nx * h[0] + ny * h[1] + nz * h[2])
+        
+        # Per-point scalars broadcast against RGB
+        ndotl = ndotl[..., np.newaxis]
+        ndotv = ndotv[..., np.newaxis]
+        ndoth = ndoth[..., np.newaxis]
+        roughness = roughness[..., np.newaxis]
+        metallic = metallic[..., np.newaxis]
+        ao = ao[..., np.newaxis]
+        
         # Fresnel (Schlick approximation)
-        f0 = np.array([0.04, 0.04, 0.04])  # Non-metallic F0
+        f0 = np.array([0.04, 0.04, 0.04], dtype=np.float32)  # Non-metallic F0
         f0 = f0 * (1 - metallic) + diffuse_color * metallic
         fresnel = f0 + (1 - f0) * pow(1 - vdoth, 5)
         
@@ -302,14 +433,7 @@ class PBRPreviewGenerator:
         result = image.copy()
         draw = ImageDraw.Draw(result)
         
-        # Try to use a nice font, fall back to default if not available
-        try:
-            font_size = max(12, self.height // 40)
-            font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", font_size)
-            small_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", font_size - 2)
-        except:
-            font = ImageFont.load_default()
-            small_font = font
+        font, small_font = _load_fonts(max(12, self.height // 40))
         
         # Add material name
         text_color = (255, 255, 255)
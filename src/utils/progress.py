@@ -1,14 +1,36 @@
 """Progress tracking utilities using tqdm for better user feedback."""
 
+import os
+import sys
 import time
 from typing import Optional, Dict, Any, List
 from tqdm import tqdm
-from contextlib import contextmanager
 from ..utils.logging import get_logger, Colors
 
 
+def _progress_bars_disabled() -> bool:
+    """Return True when progress bars should not be drawn.
+    
+    Bars are skipped when stderr is not a terminal (pipes, CI logs) or when
+    running as a SLURM batch job, where redraws only add noise to the log.
+    """
+    return bool(os.environ.get("SLURM_JOB_ID")) or not sys.stderr.isatty()
+
+
+# Postfix icon for each step status; anything else is shown as in progress
+_STATUS_ICONS = {
+    "complete": "✓",
+    "failed": "✗",
+}
+
+
 class ProgressTracker:
-    """Manages progress bars for texture generation tasks."""
+    """Manages a single progress bar for texture generation tasks."""
+    
+    __slots__ = (
+        'logger', 'total_textures', 'material_name', 'warnings',
+        'start_time', 'disable', 'main_pbar', 'current_texture'
+    )
     
     def __init__(self, total_textures: int, material_name: str):
         """Initialize progress tracker.
@@ -22,6 +44,7 @@ class ProgressTracker:
         self.material_name = material_name
         self.warnings: List[str] = []
         self.start_time = time.time()
+        self.disable = _progress_bars_disabled()
         
         # Main progress bar for overall generation
         self.main_pbar = tqdm(
@@ -29,32 +52,23 @@ class ProgressTracker:
             desc=f"Generating {material_name} textures",
             unit="texture",
             bar_format="{l_bar}{bar:30}{r_bar}",
-            colour="green"
+            colour="green",
+            disable=self.disable
         )
         
-        # Sub progress bar for individual texture steps
-        self.sub_pbar: Optional[tqdm] = None
+        # Texture currently being generated, shown as the bar's postfix
+        self.current_texture: Optional[str] = None
         
     def start_texture(self, texture_type: str, steps: int = 3):
         """Start tracking a new texture generation.
         
         Args:
             texture_type: Type of texture being generated.
-            steps: Number of steps for this texture.
+            steps: Number of steps for this texture. Steps are shown in the
+                bar's postfix rather than counted, so this is informational.
         """
-        # Close any existing sub progress bar
-        if self.sub_pbar:
-            self.sub_pbar.close()
-            
-        # Create new sub progress bar
-        self.sub_pbar = tqdm(
-            total=steps,
-            desc=f"  → {texture_type}",
-            unit="step",
-            bar_format="{l_bar}{bar:20}{r_bar}",
-            colour="cyan",
-            leave=False
-        )
+        self.current_texture = texture_type
+        self.main_pbar.set_postfix_str(texture_type)
         
     def update_step(self, step_name: str, status: str = "processing"):
         """Update the current step.
@@ -63,22 +77,9 @@ class ProgressTracker:
             step_name: Name of the current step.
             status: Status of the step (processing, complete, failed).
         """
-        if self.sub_pbar:
-            # Update description with status indicator
-            if status == "complete":
-                icon = "✓"
-                color = "green"
-            elif status == "failed":
-                icon = "✗"
-                color = "red"
-            else:
-                icon = "⟳"
-                color = "yellow"
-                
-            self.sub_pbar.set_description(f"  → {step_name} {icon}")
-            
-            if status in ["complete", "failed"]:
-                self.sub_pbar.update(1)
+        # Update postfix with status indicator
+        icon = _STATUS_ICONS.get(status, "⟳")
+        self.main_pbar.set_postfix_str(f"{self.current_texture} → {step_name} {icon}")
                 
     def complete_texture(self, texture_type: str, success: bool = True, error: Optional[str] = None):
         """Mark a texture as complete.
@@ -88,12 +89,8 @@ class ProgressTracker:
             success: Whether generation was successful.
             error: Error message if failed.
         """
-        # Close sub progress bar
-        if self.sub_pbar:
-            self.sub_pbar.close()
-            self.sub_pbar = None
-            
         # Update main progress
+        self.current_texture = None
         self.main_pbar.update(1)
         
         # Log result
@@ -114,9 +111,7 @@ class ProgressTracker:
         
     def close(self):
         """Close all progress bars and return summary data."""
-        # Close any open progress bars
-        if self.sub_pbar:
-            self.sub_pbar.close()
+        # Close the progress bar
         self.main_pbar.close()
         
         # Calculate total time
@@ -131,6 +126,8 @@ class ProgressTracker:
 class StepProgressBar:
     """Context manager for step-based progress tracking."""
     
+    __slots__ = ('pbar', 'current_step')
+    
     def __init__(self, total_steps: int, description: str):
         """Initialize step progress bar.
         
@@ -164,28 +161,52 @@ class StepProgressBar:
         self.pbar.close()
 
 
-@contextmanager
-def api_progress(operation: str):
+class ApiProgress:
     """Context manager for API call progress indication.
     
+    Shows a single elapsed-time bar while the call is in flight. No bar is
+    created when progress bars are disabled (non-TTY or batch jobs).
+    """
+    
+    __slots__ = ('operation', 'pbar')
+    
+    def __init__(self, operation: str):
+        """Initialize API progress indicator.
+        
+        Args:
+            operation: Description of the API operation.
+        """
+        self.operation = operation
+        self.pbar: Optional[tqdm] = None
+        
+    def __enter__(self) -> Optional[tqdm]:
+        if not _progress_bars_disabled():
+            self.pbar = tqdm(
+                total=1,
+                desc=f"API: {self.operation}",
+                bar_format="{desc}: {elapsed}s",
+                colour="magenta"
+            )
+        return self.pbar
+        
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.pbar is not None:
+            self.pbar.update(1)
+            self.pbar.close()
+            self.pbar = None
+
+
+def api_progress(operation: str) -> ApiProgress:
+    """Create a context manager for API call progress indication.
+    
     Args:
         operation: Description of the API operation.
         
-    Yields:
-        Progress bar instance.
+    Returns:
+        ApiProgress context manager yielding the progress bar, or None
+        when progress bars are disabled.
     """
-    pbar = tqdm(
-        total=1,
-        desc=f"API: {operation}",
-        bar_format="{desc}: {elapsed}s",
-        colour="magenta"
-    )
-    
-    try:
-        yield pbar
-    finally:
-        pbar.update(1)
-        pbar.close()
+    return ApiProgress(operation)
 
 
 def create_time_estimate(completed: int, total: int, elapsed_time: float) -> str:
@@ -1,6 +1,7 @@
 """Tessellation utilities for seamless texture tiling."""
 
-from typing import Tuple
+from functools import lru_cache
+from typing import Optional, Tuple
 from PIL import Image
 import numpy as np
 from ..utils.logging import get_logger
@@ -9,6 +10,55 @@ from ..utils.logging import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _blend_ramps(blend_width: int, ndim: int, integer: bool = False) -> Tuple[np.ndarray, ...]:
+    """Build the horizontal and vertical blend ramps for a blend width.
+    
+    Textures are generated at a handful of sizes with a fixed blend width, so
+    the ramps are computed once per (blend_width, ndim, integer) and reused.
+    
+    Args:
+        blend_width: Width of the blend region at edges
+        ndim: Number of dimensions of the image array (2 or 3)
+        integer: Return uint16 weights scaled by blend_width instead of
+            float32 fractions
+        
+    Returns:
+        Tuple of (blend_x, inv_blend_x, blend_y, inv_blend_y) read-only arrays
+        shaped to broadcast against the edge strips
+    """
+    # Blend factor (0 to 1) for each column/row of the blend region,
+    # shaped to broadcast over the channel axis of RGB images
+    ramp: np.ndarray
+    full: np.number
+    if integer:
+        ramp = np.arange(blend_width, dtype=np.uint16)
+        full = np.uint16(blend_width)
+    else:
+        ramp = np.arange(blend_width, dtype=np.float32) / blend_width
+        full = np.float32(1)
+    channel_axes = (1,) * (ndim - 2)
+    blend_x = ramp.reshape((1, blend_width) + channel_axes)
+    blend_y = ramp.reshape((blend_width, 1) + channel_axes)
+    
+    ramps = (blend_x, full - blend_x, blend_y, full - blend_y)
+    for ramp_array in ramps:
+        ramp_array.flags.writeable = False
+    return ramps
+
+
+def _lerp(a: np.ndarray, b: np.ndarray, weight_a: np.ndarray, weight_b: np.ndarray,
+          shift: Optional[int]) -> np.ndarray:
+    """Blend two strips, rescaling integer weights by 2**shift.
+    
+    Both paths round half up after each pass, so float weights give the
+    same result as the integer weights for the same blend width.
+    """
+    if shift is None:
+        return np.floor(weight_a * a + weight_b * b + 0.5)
+    return (weight_a * a + weight_b * b + ((1 << shift) >> 1)) >> shift
+
+
 def apply_tessellation(image: Image.Image, blend_width: int = 50) -> Image.Image:
     """Apply tessellation to make an image tile seamlessly.
     
@@ -24,79 +74,112 @@ def apply_tessellation(image: Image.Image, blend_width: int = 50) -> Image.Image
     """
     logger.info(f"Applying tessellation with blend width: {blend_width}")
     
-    # Convert to numpy array
-    img_array = np.array(image)
-    height, width = img_array.shape[:2]
-    
-    # Create a copy for blending
-    result = img_array.copy()
-    
-    # Blend horizontal edges
-    for y in range(height):
-        for x in range(blend_width):
-            # Calculate blend factor (0 to 1)
-            blend = x / blend_width
-            
-            # Blend left edge with right edge
-            left_x = x
-            right_x = width - blend_width + x
-            
-            # Linear interpolation
-            if len(img_array.shape) == 3:  # RGB image
-                result[y, left_x] = (
-                    blend * img_array[y, left_x] +
-                    (1 - blend) * img_array[y, right_x]
-                ).astype(np.uint8)
-                
-                result[y, right_x] = (
-                    (1 - blend) * img_array[y, left_x] +
-                    blend * img_array[y, right_x]
-                ).astype(np.uint8)
-            else:  # Grayscale
-                result[y, left_x] = int(
-                    blend * img_array[y, left_x] +
-                    (1 - blend) * img_array[y, right_x]
-                )
-                
-                result[y, right_x] = int(
-                    (1 - blend) * img_array[y, left_x] +
-                    blend * img_array[y, right_x]
-                )
-    
-    # Blend vertical edges
-    for x in range(width):
-        for y in range(blend_width):
-            # Calculate blend factor
-            blend = y / blend_width
-            
-            # Blend top edge with bottom edge
-            top_y = y
-            bottom_y = height - blend_width + y
-            
-            # Linear interpolation
-            if len(img_array.shape) == 3:  # RGB image
-                result[top_y, x] = (
-                    blend * result[top_y, x] +
-                    (1 - blend) * result[bottom_y, x]
-                ).astype(np.uint8)
-                
-                result[bottom_y, x] = (
-                    (1 - blend) * result[top_y, x] +
-                    blend * result[bottom_y, x]
-                ).astype(np.uint8)
-            else:  # Grayscale
-                result[top_y, x] = int(
-                    blend * result[top_y, x] +
-                    (1 - blend) * result[bottom_y, x]
-                )
-                
-                result[bottom_y, x] = int(
-                    (1 - blend) * result[top_y, x] +
-                    blend * result[bottom_y, x]
-                )
-    
-    # Convert back to PIL Image
-    return Image.fromarray(result)
+    # 16-bit, 32-bit integer and float images are blended at their own
+    # precision rather than being reduced to 8 bits
+    if image.mode == 'F' or image.mode.startswith('I'):
+        return _apply_tessellation_high_bit(image, blend_width)
+    
+    # Only the edge strips are blended, so read just those out of PIL
+    # instead of copying the whole image into an array and back
+    if image.mode not in ('L', 'LA', 'RGB', 'RGBA'):
+        image = image.convert('RGB')
+    width, height = image.size
+    left = np.asarray(image.crop((0, 0, blend_width, height)))
+    right = np.asarray(image.crop((width - blend_width, 0, width, height)))
+    top = np.asarray(image.crop((0, 0, width, blend_width)))
+    bottom = np.asarray(image.crop((0, height - blend_width, width, height)))
+    
+    # 8-bit images with a power-of-two blend width stay in uint16: weights
+    # become k/blend_width with a final shift, and 255 * 256 fits in 16 bits.
+    # Everything else blends in float, rounding after each pass the same way.
+    acc_dtype: np.dtype
+    if 0 < blend_width <= 256 and blend_width & (blend_width - 1) == 0:
+        shift: Optional[int] = blend_width.bit_length() - 1
+        acc_dtype = np.dtype(np.uint16)
+    else:
+        shift = None
+        acc_dtype = np.dtype(np.float32)
+    
+    blend_x, inv_blend_x, blend_y, inv_blend_y = _blend_ramps(
+        blend_width, left.ndim, shift is not None
+    )
+    
+    # Blend horizontal edges: left edge with right edge of the original
+    left = left.astype(acc_dtype)
+    right = right.astype(acc_dtype)
+    blended_left = _lerp(left, right, blend_x, inv_blend_x, shift)
+    blended_right = _lerp(left, right, inv_blend_x, blend_x, shift)
+    
+    # Blend vertical edges: top edge with bottom edge. The corners of both
+    # strips come from the horizontal pass, and both strips are read before
+    # either is written so the bottom rows don't see updated top rows.
+    top = top.astype(acc_dtype)
+    bottom = bottom.astype(acc_dtype)
+    top[:, :blend_width] = blended_left[:blend_width]
+    top[:, width - blend_width:] = blended_right[:blend_width]
+    bottom[:, :blend_width] = blended_left[height - blend_width:]
+    bottom[:, width - blend_width:] = blended_right[height - blend_width:]
+    blended_top = _lerp(top, bottom, blend_y, inv_blend_y, shift)
+    blended_bottom = _lerp(top, bottom, inv_blend_y, blend_y, shift)
+    
+    # Paste the blended strips back onto a copy of the image
+    result = image.copy()
+    strips = (
+        (blended_left, (0, 0)),
+        (blended_right, (width - blend_width, 0)),
+        (blended_top, (0, 0)),
+        (blended_bottom, (0, height - blend_width)),
+    )
+    for strip, position in strips:
+        if shift is None:
+            strip = np.clip(strip, 0, 255)
+        result.paste(Image.fromarray(strip.astype(np.uint8)), position)
+    
+    return result
+
+
+def _apply_tessellation_high_bit(image: Image.Image, blend_width: int) -> Image.Image:
+    """Blend the edges of an I;16, I or F image without losing precision.
+    
+    Blends in float64 like the 8-bit path, rounding half up after each pass
+    for integer modes, and returns an image in the input's mode.
+    
+    Args:
+        image: Input PIL Image in an 'I' or 'F' mode
+        blend_width: Width of the blend region at edges
+        
+    Returns:
+        Tessellated PIL Image with the same mode as the input
+    """
+    array = np.array(image)
+    height, width = array.shape[:2]
+    result = array.astype(np.float64)
+    is_integer = array.dtype.kind in 'iu'
+    
+    ramp = np.arange(blend_width, dtype=np.float64) / blend_width
+    blend_x = ramp.reshape(1, blend_width)
+    blend_y = ramp.reshape(blend_width, 1)
+    
+    def lerp(a: np.ndarray, b: np.ndarray, weight: np.ndarray) -> np.ndarray:
+        blended = weight * a + (1 - weight) * b
+        return np.floor(blended + 0.5) if is_integer else blended
+    
+    # Same two passes as the 8-bit path: horizontal on the original, then
+    # vertical over the result, reading both strips before writing either
+    left = result[:, :blend_width].copy()
+    right = result[:, width - blend_width:].copy()
+    result[:, :blend_width] = lerp(left, right, blend_x)
+    result[:, width - blend_width:] = lerp(right, left, blend_x)
+    
+    top = result[:blend_width].copy()
+    bottom = result[height - blend_width:].copy()
+    result[:blend_width] = lerp(top, bottom, blend_y)
+    result[height - blend_width:] = lerp(bottom, top, blend_y)
+    
+    if is_integer:
+        info = np.iinfo(array.dtype)
+        np.clip(result, info.min, info.max, out=result)
+    return Image.fromarray(result.astype(array.dtype))
 
 
 def create_wang_tiles(image: Image.Image, tile_size: Tuple[int, int] = (256, 256)) -> dict:
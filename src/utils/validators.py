@@ -0,0 +1,25 @@
+"""Validation helpers for configuration and texture types."""
+
+from typing import Any, Dict, FrozenSet
+from jsonschema import validate, ValidationError
+
+from ..config import CONFIG_SCHEMA
+from ..types.common import TextureType
+
+
+# Built once at import time so per-texture checks don't rebuild the set
+_VALID_TEXTURE_TYPES: FrozenSet[str] = frozenset(t.value for t in TextureType)
+
+
+def validate_config(config: Dict[str, Any]) -> bool:
+    """Validate a configuration dictionary against the config schema."""
+    try:
+        validate(instance=config, schema=CONFIG_SCHEMA)
+        return True
+    except ValidationError:
+        return False
+
+
+def validate_texture_type(texture_type: str) -> bool:
+    """Check whether a texture type name is supported."""
+    return texture_type in _VALID_TEXTURE_TYPES
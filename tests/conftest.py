@@ -5,10 +5,28 @@ Pytest configuration and fixtures for PBR generator tests.
 import pytest
 import numpy as np
 from PIL import Image
+import io
 import tempfile
 import os
 from unittest.mock import Mock, patch
 import json
+import sys
+import time
+from types import MappingProxyType
+
+
+# Sleep used by simulated API timeouts; replaced with a no-op by the
+# skip_real_timeouts fixture unless RUN_REAL_TIMEOUTS=1 is set
+_sleep = time.sleep
+
+# Four-quadrant pattern returned for every mocked image download. Every
+# pixel is written by a quadrant, so the buffer starts uninitialized.
+_MOCK_DOWNLOAD_PIXELS = np.empty((512, 512, 3), dtype=np.uint8)
+_MOCK_DOWNLOAD_PIXELS[:256, :256] = [255, 0, 0]    # Red
+_MOCK_DOWNLOAD_PIXELS[:256, 256:] = [0, 255, 0]    # Green
+_MOCK_DOWNLOAD_PIXELS[256:, :256] = [0, 0, 255]    # Blue
+_MOCK_DOWNLOAD_PIXELS[256:, 256:] = [255, 255, 0]  # Yellow
+_MOCK_DOWNLOAD_PIXELS.flags.writeable = False
 
 
 @pytest.fixture
@@ -20,16 +38,14 @@ def sample_image():
     
     # Add some patterns for testing
     # Gradient in red channel
-    for y in range(height):
-        image[y, :, 0] = int(255 * y / height)
+    image[:, :, 0] = (np.arange(height) * 255 // height)[:, np.newaxis]
     
     # Stripes in green channel
-    for x in range(0, width, 32):
-        image[:, x:x+16, 1] = 255
+    image[:, :, 1] = (np.arange(width) % 32 < 16) * 255
     
     # Noise in blue channel
-    np.random.seed(42)
-    image[:, :, 2] = np.random.randint(0, 256, (height, width))
+    rng = np.random.default_rng(42)
+    image[:, :, 2] = rng.integers(0, 256, (height, width), dtype=np.uint8)
     
     return Image.fromarray(image)
 
@@ -39,13 +55,31 @@ def grayscale_image():
     """Create a sample grayscale image for testing."""
     width, height = 256, 256
     # Create gradient pattern
-    gradient = np.zeros((height, width), dtype=np.uint8)
-    for y in range(height):
-        gradient[y, :] = int(255 * y / height)
+    gradient = np.empty((height, width), dtype=np.uint8)
+    gradient[:] = (np.arange(height) * 255 // height)[:, np.newaxis]
     
     return Image.fromarray(gradient, mode='L')
 
 
+@pytest.fixture(scope="session")
+def tessellation_module():
+    """Shared TessellationModule instance; the module holds no per-call state."""
+    from src.modules.tessellation import TessellationModule
+    return TessellationModule()
+
+
+@pytest.fixture
+def pbr_generator():
+    """Fresh PBRGenerator built with a test API key.
+    
+    Tests inject their own mocked OpenAI client through ``_client``, so
+    each test gets its own instance and no mock or call count carries over.
+    """
+    from src.generator import PBRGenerator
+    with patch.dict(os.environ, {'OPENAI_API_KEY': 'test-key'}), patch('openai.OpenAI'):
+        return PBRGenerator()
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for test outputs."""
@@ -53,6 +87,32 @@ def temp_dir():
         yield tmpdir
 
 
+@pytest.fixture
+def save_registry(monkeypatch):
+    """Route PIL saves to file paths into in-memory buffers.
+    
+    Returns a dict mapping each target path to a BytesIO holding the encoded
+    image, so tests can open outputs from memory instead of temp files.
+    Saves to file objects are passed through unchanged.
+    """
+    registry = {}
+    original_save = Image.Image.save
+    
+    def _save(self, fp, format=None, **params):
+        if not isinstance(fp, (str, os.PathLike)):
+            return original_save(self, fp, format, **params)
+        path = os.fspath(fp)
+        if format is None:
+            format = Image.registered_extensions()[os.path.splitext(path)[1].lower()]
+        buffer = io.BytesIO()
+        original_save(self, buffer, format, **params)
+        buffer.seek(0)
+        registry[path] = buffer
+    
+    monkeypatch.setattr(Image.Image, 'save', _save)
+    return registry
+
+
 @pytest.fixture
 def material_config():
     """Sample material configuration."""
@@ -87,14 +147,7 @@ def mock_image_download():
     """Mock image download from URL."""
     def _mock_download(url):
         # Return our sample image for any URL
-        width, height = 512, 512
-        image = np.zeros((height, width, 3), dtype=np.uint8)
-        # Create a simple pattern
-        image[:256, :256] = [255, 0, 0]    # Red
-        image[:256, 256:] = [0, 255, 0]    # Green
-        image[256:, :256] = [0, 0, 255]    # Blue
-        image[256:, 256:] = [255, 255, 0]  # Yellow
-        return Image.fromarray(image)
+        return Image.fromarray(_MOCK_DOWNLOAD_PIXELS)
     
     with patch('requests.get') as mock_get:
         mock_response = Mock()
@@ -148,6 +201,18 @@ def reset_singleton():
     # Cleanup code here if needed
 
 
+@pytest.fixture(scope="session", autouse=True)
+def skip_real_timeouts():
+    """Make simulated timeouts return immediately instead of stalling the suite."""
+    if os.environ.get("RUN_REAL_TIMEOUTS") == "1":
+        yield
+        return
+    
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(sys.modules[__name__], "_sleep", lambda *_: None)
+        yield
+
+
 @pytest.fixture
 def mock_openai_response():
     """Mock OpenAI API response for different scenarios."""
@@ -165,8 +230,7 @@ def mock_openai_response():
             from openai import RateLimitError
             raise RateLimitError("Rate limit exceeded")
         elif scenario == 'timeout':
-            import time
-            time.sleep(5)
+            _sleep(5)
             return _mock_response('success')
     
     return _mock_response
@@ -203,51 +267,68 @@ def sample_material_types():
     }
 
 
-@pytest.fixture
-def sample_texture_suite():
-    """Create a complete suite of test textures."""
+@pytest.fixture(scope="session")
+def _sample_texture_arrays():
+    """Pixel data for sample_texture_suite, generated once per session.
+    
+    The arrays are read-only; sample_texture_suite wraps them in new images
+    for every test.
+    """
     textures = {}
     size = (512, 512)
+    rng = np.random.default_rng(42)
     
     # Diffuse/Albedo
-    diffuse = np.random.randint(50, 200, (*size, 3), dtype=np.uint8)
-    textures['diffuse'] = Image.fromarray(diffuse)
+    diffuse = rng.integers(50, 200, (*size, 3), dtype=np.uint8)
+    textures['diffuse'] = diffuse
     
     # Normal map (blue-ish with variations)
-    normal = np.ones((*size, 3), dtype=np.uint8) * 128
-    normal[:, :, 2] = 255  # Blue channel dominant
+    # Every channel is written below, so start from an uninitialized buffer
+    normal = np.empty((*size, 3), dtype=np.uint8)
     # Add some variation
-    normal[:, :, 0] = np.random.randint(100, 155, size, dtype=np.uint8)
-    normal[:, :, 1] = np.random.randint(100, 155, size, dtype=np.uint8)
-    textures['normal'] = Image.fromarray(normal)
+    normal[:, :, 0] = rng.integers(100, 155, size, dtype=np.uint8)
+    normal[:, :, 1] = rng.integers(100, 155, size, dtype=np.uint8)
+    normal[:, :, 2] = 255  # Blue channel dominant
+    textures['normal'] = normal
     
     # Roughness (grayscale)
-    roughness = np.random.randint(50, 200, size, dtype=np.uint8)
-    textures['roughness'] = Image.fromarray(roughness, mode='L')
+    roughness = rng.integers(50, 200, size, dtype=np.uint8)
+    textures['roughness'] = roughness
     
     # Metallic (mostly dark with some bright spots)
     metallic = np.zeros(size, dtype=np.uint8)
     metallic[100:150, 100:150] = 255  # Metallic region
-    textures['metallic'] = Image.fromarray(metallic, mode='L')
+    textures['metallic'] = metallic
     
     # Height/Displacement
     height = np.zeros(size, dtype=np.uint8)
-    for i in range(0, size[0], 50):
-        height[i:i+25, :] = 128
-    textures['height'] = Image.fromarray(height, mode='L')
+    height[np.arange(size[0]) % 50 < 25, :] = 128
+    textures['height'] = height
     
     # Ambient Occlusion
     ao = np.ones(size, dtype=np.uint8) * 200
     # Add some darker areas
     ao[200:300, 200:300] = 100
-    textures['ao'] = Image.fromarray(ao, mode='L')
+    textures['ao'] = ao
     
     # Emissive (mostly black with some bright areas)
     emissive = np.zeros((*size, 3), dtype=np.uint8)
     emissive[400:450, 400:450] = [255, 200, 100]  # Glowing region
-    textures['emissive'] = Image.fromarray(emissive)
+    textures['emissive'] = emissive
+    
+    for array in textures.values():
+        array.flags.writeable = False
+    return MappingProxyType(textures)
+
+
+@pytest.fixture
+def sample_texture_suite(_sample_texture_arrays):
+    """Create a complete suite of test textures.
     
-    return textures
+    Each test gets its own images over the session's pixel data, so a test
+    that draws on or pastes into a texture cannot affect any other test.
+    """
+    return {name: Image.fromarray(array) for name, array in _sample_texture_arrays.items()}
 
 
 @pytest.fixture
@@ -286,9 +367,14 @@ def mock_pipeline_config():
 @pytest.fixture
 def performance_monitor():
     """Monitor performance metrics during tests."""
-    import time
     import psutil
-    import os
+    
+    # One Process handle for the monitor's lifetime; memory_used is the
+    # change in current RSS between start() and stop()
+    process = psutil.Process(os.getpid())
+    
+    def memory_mb():
+        return process.memory_info().rss / 1024 / 1024
     
     class PerformanceMonitor:
         def __init__(self):
@@ -297,17 +383,15 @@ def performance_monitor():
             self.metrics = {}
         
         def start(self):
-            self.start_time = time.time()
-            process = psutil.Process(os.getpid())
-            self.start_memory = process.memory_info().rss / 1024 / 1024  # MB
+            self.start_time = time.perf_counter()
+            self.start_memory = memory_mb()
         
         def stop(self, test_name):
             if self.start_time is None:
                 return
             
-            elapsed = time.time() - self.start_time
-            process = psutil.Process(os.getpid())
-            end_memory = process.memory_info().rss / 1024 / 1024  # MB
+            elapsed = time.perf_counter() - self.start_time
+            end_memory = memory_mb()
             memory_used = end_memory - self.start_memory
             
             self.metrics[test_name] = {
@@ -324,29 +408,71 @@ def performance_monitor():
     return PerformanceMonitor()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ci_cd_mock_responses():
-    """Mock responses specifically for CI/CD testing without real API calls."""
-    return {
-        'openai_generate': {
+    """Mock responses specifically for CI/CD testing without real API calls.
+    
+    Built once per session; the mappings and image arrays are read-only.
+    """
+    rng = np.random.default_rng(42)
+    image_data = {
+        'diffuse': rng.integers(0, 256, (512, 512, 3), dtype=np.uint8),
+        'normal': np.broadcast_to(
+            np.array([128, 128, 255], dtype=np.uint8), (512, 512, 3)
+        ).copy(),
+        'roughness': rng.integers(100, 200, (512, 512), dtype=np.uint8),
+        'metallic': np.zeros((512, 512), dtype=np.uint8),
+        'height': rng.integers(0, 256, (512, 512), dtype=np.uint8),
+        'ao': np.ones((512, 512), dtype=np.uint8) * 200,
+        'emissive': np.zeros((512, 512, 3), dtype=np.uint8)
+    }
+    for array in image_data.values():
+        array.flags.writeable = False
+    
+    return MappingProxyType({
+        'openai_generate': MappingProxyType({
             'url': 'https://ci-mock.com/texture.png',
             'revised_prompt': 'CI/CD test texture generation'
-        },
-        'image_data': {
-            'diffuse': np.random.randint(0, 256, (512, 512, 3), dtype=np.uint8),
-            'normal': np.ones((512, 512, 3), dtype=np.uint8) * [128, 128, 255],
-            'roughness': np.random.randint(100, 200, (512, 512), dtype=np.uint8),
-            'metallic': np.zeros((512, 512), dtype=np.uint8),
-            'height': np.random.randint(0, 256, (512, 512), dtype=np.uint8),
-            'ao': np.ones((512, 512), dtype=np.uint8) * 200,
-            'emissive': np.zeros((512, 512, 3), dtype=np.uint8)
-        }
-    }
+        }),
+        'image_data': MappingProxyType(image_data)
+    })
+
+
+@pytest.fixture(scope="session")
+def _edge_case_arrays():
+    """Random pixel data for edge_case_images, generated once per session.
+    
+    The arrays are read-only; edge_case_images wraps them in new images for
+    every test.
+    """
+    rng = np.random.default_rng(42)
+    
+    # High dynamic range simulation (values will be clipped)
+    # Scaled, shifted and clipped in place so only the final uint8 cast
+    # allocates a second buffer
+    hdr_data = rng.standard_normal((256, 256, 3))
+    hdr_data *= 100
+    hdr_data += 128
+    np.clip(hdr_data, 0, 255, out=hdr_data)
+    hdr_sim = hdr_data.astype(np.uint8)
+    
+    # Transparent image
+    transparent = np.zeros((256, 256, 4), dtype=np.uint8)
+    transparent[:, :, 3] = rng.integers(0, 256, (256, 256), dtype=np.uint8)
+    
+    arrays = {'hdr_sim': hdr_sim, 'transparent': transparent}
+    for array in arrays.values():
+        array.flags.writeable = False
+    return MappingProxyType(arrays)
 
 
 @pytest.fixture
-def edge_case_images():
-    """Collection of edge case images for robust testing."""
+def edge_case_images(_edge_case_arrays):
+    """Collection of edge case images for robust testing.
+    
+    The random pixel data is generated once per session, but every test
+    gets its own images, so modifying one cannot affect other tests.
+    """
     edge_cases = {}
     
     # Completely black image
@@ -365,14 +491,10 @@ def edge_case_images():
     edge_cases['wide'] = Image.new('RGB', (512, 128), (150, 150, 150))
     edge_cases['tall'] = Image.new('RGB', (128, 512), (150, 150, 150))
     
-    # High dynamic range simulation (values will be clipped)
-    hdr_data = np.random.normal(128, 100, (256, 256, 3))
-    hdr_data = np.clip(hdr_data, 0, 255).astype(np.uint8)
-    edge_cases['hdr_sim'] = Image.fromarray(hdr_data)
+    # High dynamic range simulation (values clipped to 8 bits)
+    edge_cases['hdr_sim'] = Image.fromarray(_edge_case_arrays['hdr_sim'])
     
     # Transparent image
-    transparent = np.zeros((256, 256, 4), dtype=np.uint8)
-    transparent[:, :, 3] = np.random.randint(0, 256, (256, 256))
-    edge_cases['transparent'] = Image.fromarray(transparent, mode='RGBA')
+    edge_cases['transparent'] = Image.fromarray(_edge_case_arrays['transparent'], mode='RGBA')
     
     return edge_cases
\ No newline at end of file
@@ -4,6 +4,7 @@ import pytest
 import os
 import tempfile
 import json
+import time
 from unittest.mock import Mock, patch, MagicMock
 import numpy as np
 from PIL import Image
@@ -13,6 +14,18 @@ from src.core.generator import PBRGenerator
 from src.core.orchestrator import PipelineOrchestrator
 from src.config import ConfigLoader
 
+# Every test here mocks network I/O and writes only to its own temp_dir,
+# so the module can be spread across pytest-xdist workers (-n auto)
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture
+def mock_openai_cls(monkeypatch):
+    """Replace OpenAIInterface with a MagicMock for the duration of a test."""
+    mock_cls = MagicMock()
+    monkeypatch.setattr('src.interfaces.openai_api.OpenAIInterface', mock_cls)
+    return mock_cls
+
 
 class TestFullPipelineIntegration:
     """Integration tests for complete PBR generation workflow."""
@@ -51,12 +64,10 @@ class TestFullPipelineIntegration:
             }
         }
     
-    @pytest.mark.integration
-    @patch('src.interfaces.openai_api.OpenAIInterface')
-    def test_complete_pbr_generation_workflow(self, mock_openai, integration_config, ci_cd_mock_responses):
+    def test_complete_pbr_generation_workflow(self, mock_openai_cls, integration_config, ci_cd_mock_responses):
         """Test the complete PBR generation workflow from config to output."""
         # Setup mock OpenAI responses
-        mock_openai_instance = mock_openai.return_value
+        mock_openai_instance = mock_openai_cls.return_value
         
         # Mock image generation for each texture type
         def mock_generate_image(prompt, size, quality):
@@ -108,19 +119,20 @@ class TestFullPipelineIntegration:
             'weathered_metal_emissive.png'
         ]
         
+        # One directory listing instead of a stat per expected file
+        present = {entry.name for entry in os.scandir(output_dir)}
+        missing = set(expected_files) - present
+        assert not missing, f"Expected files not found: {sorted(missing)}"
+        
         for filename in expected_files:
-            filepath = os.path.join(output_dir, filename)
-            assert os.path.exists(filepath), f"Expected file {filename} not found"
-            
-            # Verify file is a valid image
-            img = Image.open(filepath)
-            assert img.size == (512, 512)
+            # Verify file is a valid image; the size comes from the PNG
+            # header, and the context manager closes it without decoding
+            with Image.open(os.path.join(output_dir, filename)) as img:
+                assert img.size == (512, 512)
         
         # Verify preview was created if enabled
-        preview_path = os.path.join(output_dir, 'weathered_metal_preview.png')
-        assert os.path.exists(preview_path)
+        assert 'weathered_metal_preview.png' in present
     
-    @pytest.mark.integration
     def test_seamless_texture_pipeline(self, integration_config, mock_openai_client, temp_dir):
         """Test pipeline with seamless texture generation."""
         # Enable seamless in config
@@ -144,31 +156,28 @@ class TestFullPipelineIntegration:
             # Verify tiling validation was performed
             assert mock_tessellation_instance.validate_tiling.call_count >= 7
     
-    @pytest.mark.integration
-    def test_parallel_generation_performance(self, integration_config, mock_openai_client, performance_monitor):
+    def test_parallel_generation_performance(self, integration_config, mock_openai_client):
         """Test parallel texture generation performance."""
         # Enable parallel processing
         integration_config['generation']['parallel'] = True
         integration_config['generation']['max_workers'] = 4
         
-        performance_monitor.start()
-        
-        # Run pipeline with parallel processing
+        # Run pipeline with parallel processing, timing only the pipeline
+        # itself with a direct counter read on either side
         orchestrator = PipelineOrchestrator(integration_config)
         orchestrator._openai_client = mock_openai_client
         
+        start_ns = time.perf_counter_ns()
         results = orchestrator.generate_pbr_textures()
-        
-        metrics = performance_monitor.stop('parallel_generation')
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
         
         # Verify all textures were generated
         assert len(results) == 7
         
         # Performance should be reasonable (under 10 seconds for mocked calls)
-        assert metrics['duration'] < 10.0
+        assert duration < 10.0
     
-    @pytest.mark.integration
-    def test_error_recovery_and_retry(self, integration_config, temp_dir):
+    def test_error_recovery_and_retry(self, integration_config, temp_dir, mock_openai_cls):
         """Test pipeline error recovery and retry mechanisms."""
         error_count = {'count': 0}
         
@@ -181,27 +190,25 @@ class TestFullPipelineIntegration:
             # Return success
             return Image.new('RGB', (512, 512), color=(100, 100, 100))
         
-        with patch('src.interfaces.openai_api.OpenAIInterface') as mock_openai:
-            mock_instance = mock_openai.return_value
-            mock_instance.generate_image.side_effect = mock_generate_with_errors
-            
-            # Configure retry settings
-            integration_config['generation']['retries'] = 3
-            integration_config['generation']['retry_delay'] = 0.1
-            
-            orchestrator = PipelineOrchestrator(integration_config)
-            
-            # Should succeed after retries
-            results = orchestrator.generate_pbr_textures()
-            
-            # Verify generation succeeded
-            assert 'diffuse' in results
-            
-            # Verify retries occurred
-            assert error_count['count'] > 2
+        mock_instance = mock_openai_cls.return_value
+        mock_instance.generate_image.side_effect = mock_generate_with_errors
+        
+        # Configure retry settings
+        integration_config['generation']['retries'] = 3
+        integration_config['generation']['retry_delay'] = 0.1
+        
+        orchestrator = PipelineOrchestrator(integration_config)
+        
+        # Should succeed after retries
+        results = orchestrator.generate_pbr_textures()
+        
+        # Verify generation succeeded
+        assert 'diffuse' in results
+        
+        # Verify retries occurred
+        assert error_count['count'] > 2
     
-    @pytest.mark.integration
-    def test_material_preset_pipeline(self, temp_dir):
+    def test_material_preset_pipeline(self, temp_dir, mock_openai_cls):
         """Test pipeline with material presets."""
         # Create config with material presets
         preset_config = {
@@ -230,20 +237,18 @@ class TestFullPipelineIntegration:
             }
         }
         
-        with patch('src.interfaces.openai_api.OpenAIInterface') as mock_openai:
-            mock_instance = mock_openai.return_value
-            mock_instance.generate_image.return_value = Image.new('RGB', (256, 256))
-            
-            orchestrator = PipelineOrchestrator(preset_config)
-            results = orchestrator.generate_pbr_textures()
-            
-            # Verify preset properties were applied
-            assert len(results) == 3
-            
-            # Check that preset values influenced generation
-            # (In real implementation, these would affect the prompts)
+        mock_instance = mock_openai_cls.return_value
+        mock_instance.generate_image.return_value = Image.new('RGB', (256, 256))
+        
+        orchestrator = PipelineOrchestrator(preset_config)
+        results = orchestrator.generate_pbr_textures()
+        
+        # Verify preset properties were applied
+        assert len(results) == 3
+        
+        # Check that preset values influenced generation
+        # (In real implementation, these would affect the prompts)
     
-    @pytest.mark.integration
     def test_multi_resolution_generation(self, integration_config, mock_openai_client, temp_dir):
         """Test generating textures at multiple resolutions."""
         # Configure multi-resolution
@@ -257,9 +262,14 @@ class TestFullPipelineIntegration:
         }
         
         with patch('PIL.Image.Image.resize') as mock_resize:
-            # Mock resize to return appropriately sized images
+            # Mock resize to return appropriately sized images, filling one
+            # prototype per size and handing out copies
+            prototypes = {}
+            
             def resize_side_effect(size, **kwargs):
-                return Image.new('RGB', size, color=(100, 100, 100))
+                if size not in prototypes:
+                    prototypes[size] = Image.new('RGB', size, color=(100, 100, 100))
+                return prototypes[size].copy()
             
             mock_resize.side_effect = resize_side_effect
             
@@ -276,7 +286,6 @@ class TestFullPipelineIntegration:
                 diffuse_path = os.path.join(output_dir, f'weathered_metal_diffuse_{res_name}.png')
                 # In real implementation, these would exist
     
-    @pytest.mark.integration
     def test_post_processing_pipeline(self, integration_config, mock_openai_client):
         """Test post-processing features in the pipeline."""
         # Configure post-processing
@@ -303,8 +312,7 @@ class TestFullPipelineIntegration:
             # Verify post-processing was applied
             # In real implementation, check that filters were called
     
-    @pytest.mark.integration
-    def test_batch_material_generation(self, temp_dir):
+    def test_batch_material_generation(self, temp_dir, mock_openai_cls):
         """Test generating multiple material variants in batch."""
         batch_config = {
             "project": {"name": "batch-test", "version": "1.0.0"},
@@ -336,28 +344,26 @@ class TestFullPipelineIntegration:
             }
         }
         
-        with patch('src.interfaces.openai_api.OpenAIInterface') as mock_openai:
-            mock_instance = mock_openai.return_value
-            mock_instance.generate_image.return_value = Image.new('RGB', (256, 256))
-            
-            orchestrator = PipelineOrchestrator(batch_config)
-            
-            # Process batch
-            all_results = orchestrator.generate_batch_materials()
-            
-            # Verify all materials were generated
-            assert len(all_results) == 3
-            assert 'clean_metal' in all_results
-            assert 'rusty_metal' in all_results
-            assert 'painted_metal' in all_results
-            
-            # Verify directory structure
-            for material_name in ['clean_metal', 'rusty_metal', 'painted_metal']:
-                material_dir = os.path.join(temp_dir, material_name)
-                # In real implementation, check directory exists
+        mock_instance = mock_openai_cls.return_value
+        mock_instance.generate_image.return_value = Image.new('RGB', (256, 256))
+        
+        orchestrator = PipelineOrchestrator(batch_config)
+        
+        # Process batch
+        all_results = orchestrator.generate_batch_materials()
+        
+        # Verify all materials were generated
+        assert len(all_results) == 3
+        assert 'clean_metal' in all_results
+        assert 'rusty_metal' in all_results
+        assert 'painted_metal' in all_results
+        
+        # Verify directory structure
+        for material_name in ['clean_metal', 'rusty_metal', 'painted_metal']:
+            material_dir = os.path.join(temp_dir, material_name)
+            # In real implementation, check directory exists
     
-    @pytest.mark.integration
-    def test_cache_functionality(self, integration_config, temp_dir):
+    def test_cache_functionality(self, integration_config, temp_dir, mock_openai_cls):
         """Test caching functionality to avoid regenerating identical textures."""
         # Enable caching
         integration_config['cache'] = {
@@ -372,25 +378,23 @@ class TestFullPipelineIntegration:
             call_count['count'] += 1
             return Image.new('RGB', (512, 512))
         
-        with patch('src.interfaces.openai_api.OpenAIInterface') as mock_openai:
-            mock_instance = mock_openai.return_value
-            mock_instance.generate_image.side_effect = mock_generate_counting
-            
-            # First run
-            orchestrator1 = PipelineOrchestrator(integration_config)
-            results1 = orchestrator1.generate_pbr_textures()
-            first_count = call_count['count']
-            
-            # Second run with same config (should use cache)
-            orchestrator2 = PipelineOrchestrator(integration_config)
-            results2 = orchestrator2.generate_pbr_textures()
-            second_count = call_count['count']
-            
-            # API should not be called again if cache is working
-            # In real implementation, this would be true:
-            # assert second_count == first_count
+        mock_instance = mock_openai_cls.return_value
+        mock_instance.generate_image.side_effect = mock_generate_counting
+        
+        # First run
+        orchestrator1 = PipelineOrchestrator(integration_config)
+        results1 = orchestrator1.generate_pbr_textures()
+        first_count = call_count['count']
+        
+        # Second run with same config (should use cache)
+        orchestrator2 = PipelineOrchestrator(integration_config)
+        results2 = orchestrator2.generate_pbr_textures()
+        second_count = call_count['count']
+        
+        # API should not be called again if cache is working
+        # In real implementation, this would be true:
+        # assert second_count == first_count
     
-    @pytest.mark.integration
     @pytest.mark.slow
     def test_stress_test_pipeline(self, integration_config, mock_openai_client):
         """Stress test the pipeline with many texture types and high resolution."""
@@ -402,10 +406,12 @@ class TestFullPipelineIntegration:
             'specular', 'glossiness', 'opacity', 'displacement'
         ]
         
-        # Mock to return large images
+        # Mock to return large images: fill one 2048x2048 prototype up front
+        # and hand out copies rather than allocating and filling per call
+        large_image = Image.new('RGB', (2048, 2048), color=(100, 100, 100))
+        
         def create_large_image(prompt, size, quality):
-            # Create 2048x2048 image
-            return Image.new('RGB', (2048, 2048), color=(100, 100, 100))
+            return large_image.copy()
         
         mock_openai_client.generate_image.side_effect = create_large_image
         
@@ -418,7 +424,6 @@ class TestFullPipelineIntegration:
         # Verify all requested textures were generated
         assert len(results) >= 7  # At least the standard PBR maps
     
-    @pytest.mark.integration
     def test_custom_module_integration(self, integration_config, temp_dir):
         """Test integration with custom texture generation modules."""
         # Add custom module configuration
@@ -443,7 +448,6 @@ class TestFullPipelineIntegration:
             # results = orchestrator.generate_pbr_textures()
 
 
-@pytest.mark.integration
 class TestPipelineValidation:
     """Test pipeline validation and quality checks."""
     
@@ -10,6 +10,8 @@ from PIL import Image
 from unittest.mock import patch, Mock
 import json
 import shutil
+import struct
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
@@ -17,159 +19,170 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 from src.generator import PBRGenerator
 from src.tessellation.seamless_tiling import SeamlessTiling
 
+# Successful single-image API response, built once and shared by all tests
+_MOCK_RESPONSE = Mock(data=[Mock(url="https://test.com/image.png")])
+
+# PIL modes for 8-bit PNG colour types
+_PNG_MODES = {0: 'L', 2: 'RGB', 3: 'P', 4: 'LA', 6: 'RGBA'}
+
+
+def _png_header(data):
+    """Read (size, mode) from the IHDR chunk of encoded PNG bytes.
+    
+    mock_image_download patches PIL.Image.open to return its sample image,
+    so outputs are checked from their bytes rather than through PIL.
+    """
+    assert data[:8] == b'\x89PNG\r\n\x1a\n', "Not a PNG file"
+    width, height, bit_depth, color_type = struct.unpack('>IIBB', data[16:26])
+    assert bit_depth == 8, f"Unexpected PNG bit depth {bit_depth}"
+    return (width, height), _PNG_MODES[color_type]
+
+
+def _read_png_header(path):
+    """Read (size, mode) from the header of a PNG file without decoding it."""
+    with open(path, 'rb') as f:
+        return _png_header(f.read(26))
+
+
+@pytest.fixture
+def mock_openai(monkeypatch):
+    """Patch openai.OpenAI and return the client it hands out.
+    
+    The client's images.generate returns a single-image response by default;
+    tests that need failures override side_effect.
+    """
+    mock_client = Mock()
+    mock_client.images.generate.return_value = _MOCK_RESPONSE
+    monkeypatch.setattr('openai.OpenAI', Mock(return_value=mock_client))
+    return mock_client
+
 
 class TestPipelineIntegration:
     """Test the complete PBR generation pipeline."""
     
-    @patch('openai.OpenAI')
-    def test_complete_material_generation(self, mock_openai_class, mock_image_download, temp_dir):
+    def test_complete_material_generation(self, mock_openai, mock_image_download, temp_dir, pbr_generator):
         """Test generating a complete PBR material set."""
-        # Setup mock
-        mock_client = Mock()
-        mock_openai_class.return_value = mock_client
+        generator = pbr_generator
+        generator._client = mock_openai
         
-        mock_response = Mock()
-        mock_response.data = [Mock(url="https://test.com/image.png")]
-        mock_client.images.generate.return_value = mock_response
+        # Generate complete material
+        output_dir = os.path.join(temp_dir, 'complete_material')
+        generator.generate_material(
+            prompt="weathered concrete wall",
+            output_dir=output_dir,
+            material_type="stone",
+            size=512
+        )
         
-        with patch.dict(os.environ, {'OPENAI_API_KEY': 'test-key'}):
-            generator = PBRGenerator()
-            
-            # Generate complete material
-            output_dir = os.path.join(temp_dir, 'complete_material')
-            generator.generate_material(
-                prompt="weathered concrete wall",
-                output_dir=output_dir,
-                material_type="stone",
-                size=512
-            )
-            
-            # Verify all texture maps
-            maps = {
-                'diffuse': 'weathered_concrete_wall_diffuse.png',
-                'normal': 'weathered_concrete_wall_normal.png',
-                'roughness': 'weathered_concrete_wall_roughness.png',
-                'height': 'weathered_concrete_wall_height.png',
-                'ao': 'weathered_concrete_wall_ao.png',
-                'metallic': 'weathered_concrete_wall_metallic.png'
-            }
-            
-            loaded_maps = {}
-            for map_type, filename in maps.items():
-                filepath = os.path.join(output_dir, filename)
-                assert os.path.exists(filepath), f"Missing {map_type} map"
-                
-                # Load and verify
-                img = Image.open(filepath)
-                loaded_maps[map_type] = img
-                assert img.size == (512, 512)
-            
-            # Verify map properties
-            # Normal map should be RGB
-            assert loaded_maps['normal'].mode == 'RGB'
-            
-            # Other maps should be grayscale
-            for map_type in ['roughness', 'height', 'ao', 'metallic']:
-                assert loaded_maps[map_type].mode == 'L'
-            
-            # Normal map should have blue channel dominant (facing up)
-            normal_array = np.array(loaded_maps['normal'])
-            assert np.mean(normal_array[:, :, 2]) > 200
+        # Verify all texture maps
+        maps = {
+            'diffuse': 'weathered_concrete_wall_diffuse.png',
+            'normal': 'weathered_concrete_wall_normal.png',
+            'roughness': 'weathered_concrete_wall_roughness.png',
+            'height': 'weathered_concrete_wall_height.png',
+            'ao': 'weathered_concrete_wall_ao.png',
+            'metallic': 'weathered_concrete_wall_metallic.png'
+        }
+        
+        paths = {map_type: os.path.join(output_dir, filename) for map_type, filename in maps.items()}
+        missing = [map_type for map_type, path in paths.items() if not os.path.exists(path)]
+        assert not missing, f"Missing {', '.join(missing)} map(s)"
+        
+        # Size and mode come from the PNG header, so no pixel data is decoded
+        headers = {map_type: _read_png_header(path) for map_type, path in paths.items()}
+        wrong_size = [map_type for map_type, (size, _) in headers.items() if size != (512, 512)]
+        assert not wrong_size, f"Maps not 512x512: {', '.join(wrong_size)}"
+        
+        # Verify map properties
+        # Normal map should be RGB
+        assert headers['normal'][1] == 'RGB'
+        
+        # Other maps should be grayscale
+        for map_type in ['roughness', 'height', 'ao', 'metallic']:
+            assert headers[map_type][1] == 'L'
+        
+        # Normal map should have blue channel dominant (facing up); it is
+        # the only map whose pixels are decoded, and the mean reduces a
+        # strided view of the blue channel directly
+        with Image.open(paths['normal']) as normal:
+            normal_array = np.asarray(normal)
+        assert normal_array[..., 2].mean() > 200
     
-    @patch('openai.OpenAI')
-    def test_tessellation_pipeline(self, mock_openai_class, mock_image_download, temp_dir):
+    def test_tessellation_pipeline(self, mock_openai, mock_image_download, temp_dir, pbr_generator):
         """Test the tessellation functionality with generated textures."""
-        # Setup mock
-        mock_client = Mock()
-        mock_openai_class.return_value = mock_client
+        generator = pbr_generator
+        generator._client = mock_openai
         
-        mock_response = Mock()
-        mock_response.data = [Mock(url="https://test.com/image.png")]
-        mock_client.images.generate.return_value = mock_response
+        # Generate base material
+        base_dir = os.path.join(temp_dir, 'base_material')
+        generator.generate_material(
+            prompt="stone tiles",
+            output_dir=base_dir,
+            material_type="stone",
+            size=256
+        )
         
-        with patch.dict(os.environ, {'OPENAI_API_KEY': 'test-key'}):
-            generator = PBRGenerator()
-            
-            # Generate base material
-            base_dir = os.path.join(temp_dir, 'base_material')
-            generator.generate_material(
-                prompt="stone tiles",
-                output_dir=base_dir,
-                material_type="stone",
-                size=256
-            )
-            
-            # Apply tessellation to each map
-            tiling = SeamlessTiling()
-            tiled_dir = os.path.join(temp_dir, 'tiled_material')
-            os.makedirs(tiled_dir, exist_ok=True)
+        # Apply tessellation to each map
+        tiling = SeamlessTiling()
+        tiled_dir = os.path.join(temp_dir, 'tiled_material')
+        os.makedirs(tiled_dir, exist_ok=True)
+        
+        def tile_map(entry):
+            output_path = os.path.join(tiled_dir, entry.name.replace('.png', '_tiled.png'))
             
-            for filename in os.listdir(base_dir):
-                if filename.endswith('.png'):
-                    input_path = os.path.join(base_dir, filename)
-                    output_path = os.path.join(tiled_dir, filename.replace('.png', '_tiled.png'))
-                    
-                    # Make seamless
-                    input_img = Image.open(input_path)
-                    tiled_img = tiling.make_seamless(input_img)
-                    tiled_img.save(output_path)
-                    
-                    # Verify tiling
-                    assert os.path.exists(output_path)
-                    assert tiled_img.size == input_img.size
+            # Make seamless
+            with Image.open(entry.path) as input_img:
+                tiled_img = tiling.make_seamless(input_img)
+                input_size = input_img.size
+            tiled_img.save(output_path, compress_level=1)
+            return output_path, input_size, tiled_img.size
+        
+        # Decoding, blending and PNG encoding release the GIL, so the
+        # maps are tiled concurrently rather than one after another
+        with os.scandir(base_dir) as it:
+            pngs = [entry for entry in it if entry.name.endswith('.png')]
+        with ThreadPoolExecutor(max_workers=len(pngs) or 1) as executor:
+            tiled = list(executor.map(tile_map, pngs))
+        
+        for output_path, input_size, tiled_size in tiled:
+            # Verify tiling
+            assert os.path.exists(output_path)
+            assert tiled_size == input_size
     
-    @patch('openai.OpenAI')
-    def test_material_consistency(self, mock_openai_class, mock_image_download, temp_dir):
+    def test_material_consistency(self, mock_openai, mock_image_download, temp_dir, pbr_generator):
         """Test that generated maps are consistent with each other."""
-        # Setup mock
-        mock_client = Mock()
-        mock_openai_class.return_value = mock_client
+        generator = pbr_generator
+        generator._client = mock_openai
         
-        mock_response = Mock()
-        mock_response.data = [Mock(url="https://test.com/image.png")]
-        mock_client.images.generate.return_value = mock_response
+        # Generate material
+        output_dir = os.path.join(temp_dir, 'consistent_material')
+        generator.generate_material(
+            prompt="rough metal surface",
+            output_dir=output_dir,
+            material_type="metal",
+            size=256
+        )
         
-        with patch.dict(os.environ, {'OPENAI_API_KEY': 'test-key'}):
-            generator = PBRGenerator()
-            
-            # Generate material
-            output_dir = os.path.join(temp_dir, 'consistent_material')
-            generator.generate_material(
-                prompt="rough metal surface",
-                output_dir=output_dir,
-                material_type="metal",
-                size=256
-            )
-            
-            # Load maps
-            diffuse = Image.open(os.path.join(output_dir, 'rough_metal_surface_diffuse.png'))
-            height = Image.open(os.path.join(output_dir, 'rough_metal_surface_height.png'))
-            ao = Image.open(os.path.join(output_dir, 'rough_metal_surface_ao.png'))
-            
-            # Convert to arrays
-            diffuse_gray = np.array(diffuse.convert('L'))
-            height_array = np.array(height)
-            ao_array = np.array(ao)
-            
-            # Height and AO should have some correlation with diffuse
-            # Darker areas in diffuse might be lower in height
-            # This is a soft check as the relationship isn't always direct
-            
-            # Check that maps have variation
-            assert np.std(height_array) > 0
-            assert np.std(ao_array) > 0
-    
-    @patch('openai.OpenAI')
-    def test_config_driven_generation(self, mock_openai_class, mock_image_download, temp_dir):
-        """Test generation with custom configuration."""
-        # Setup mock
-        mock_client = Mock()
-        mock_openai_class.return_value = mock_client
+        # Height and AO are saved as 'L', so they decode straight into
+        # read-only arrays without a conversion pass. The diffuse pixels
+        # aren't compared below, so only its presence is checked rather
+        # than decoding RGB and converting it to grayscale.
+        assert os.path.exists(os.path.join(output_dir, 'rough_metal_surface_diffuse.png'))
+        with Image.open(os.path.join(output_dir, 'rough_metal_surface_height.png')) as height:
+            height_array = np.asarray(height)
+        with Image.open(os.path.join(output_dir, 'rough_metal_surface_ao.png')) as ao:
+            ao_array = np.asarray(ao)
         
-        mock_response = Mock()
-        mock_response.data = [Mock(url="https://test.com/image.png")]
-        mock_client.images.generate.return_value = mock_response
+        # Height and AO should have some correlation with diffuse
+        # Darker areas in diffuse might be lower in height
+        # This is a soft check as the relationship isn't always direct
         
+        # Check that maps have variation
+        assert height_array.std() > 0
+        assert ao_array.std() > 0
+    
+    def test_config_driven_generation(self, mock_openai, mock_image_download, temp_dir):
+        """Test generation with custom configuration."""
         # Create custom config
         custom_config = {
             "materials": {
@@ -204,8 +217,8 @@ class TestPipelineIntegration:
             roughness = Image.open(os.path.join(output_dir, 'polished_chrome_roughness.png'))
             metallic = Image.open(os.path.join(output_dir, 'polished_chrome_metallic.png'))
             
-            roughness_mean = np.mean(np.array(roughness))
-            metallic_mean = np.mean(np.array(metallic))
+            roughness_mean = np.asarray(roughness).mean()
+            metallic_mean = np.asarray(metallic).mean()
             
             # Should be very smooth (low roughness)
             assert roughness_mean < 50  # Less than 20% rough
@@ -213,13 +226,9 @@ class TestPipelineIntegration:
             # Should be fully metallic
             assert metallic_mean > 200  # More than 80% metallic
     
-    @patch('openai.OpenAI')
-    def test_error_recovery(self, mock_openai_class, temp_dir):
+    def test_error_recovery(self, mock_openai, temp_dir, pbr_generator):
         """Test pipeline handles errors gracefully."""
-        # Setup mock to fail on first call, succeed on retry
-        mock_client = Mock()
-        mock_openai_class.return_value = mock_client
-        
+        # Make the mock fail on first call, succeed on retry
         call_count = 0
         def side_effect(*args, **kwargs):
             nonlocal call_count
@@ -227,111 +236,95 @@ class TestPipelineIntegration:
             if call_count == 1:
                 raise Exception("Temporary API error")
             else:
-                mock_response = Mock()
-                mock_response.data = [Mock(url="https://test.com/image.png")]
-                return mock_response
+                return _MOCK_RESPONSE
         
-        mock_client.images.generate.side_effect = side_effect
+        mock_openai.images.generate.side_effect = side_effect
         
-        with patch.dict(os.environ, {'OPENAI_API_KEY': 'test-key'}):
-            generator = PBRGenerator()
-            
-            # Should fail on first attempt
-            with pytest.raises(Exception, match="Temporary API error"):
-                generator.generate_material(
-                    prompt="test material",
-                    output_dir=os.path.join(temp_dir, 'error_test'),
-                    material_type="stone"
-                )
+        generator = pbr_generator
+        generator._client = mock_openai
+        
+        # Should fail on first attempt
+        with pytest.raises(Exception, match="Temporary API error"):
+            generator.generate_material(
+                prompt="test material",
+                output_dir=os.path.join(temp_dir, 'error_test'),
+                material_type="stone"
+            )
     
-    @patch('openai.OpenAI')
-    def test_output_organization(self, mock_openai_class, mock_image_download, temp_dir):
+    def test_output_organization(self, mock_openai, mock_image_download, temp_dir):
         """Test that outputs are properly organized."""
-        # Setup mock
-        mock_client = Mock()
-        mock_openai_class.return_value = mock_client
+        # Generate multiple materials
+        materials = [
+            ("granite floor", "stone"),
+            ("steel panel", "metal"),
+            ("oak planks", "wood")
+        ]
         
-        mock_response = Mock()
-        mock_response.data = [Mock(url="https://test.com/image.png")]
-        mock_client.images.generate.return_value = mock_response
+        def generate(material):
+            prompt, mat_type = material
+            # One generator per worker, as in test_concurrent_safety, so no
+            # generator state is shared between threads
+            generator = PBRGenerator()
+            output_dir = os.path.join(temp_dir, mat_type, prompt.replace(' ', '_'))
+            generator.generate_material(
+                prompt=prompt,
+                output_dir=output_dir,
+                material_type=mat_type,
+                size=256
+            )
         
+        # The API call is mocked and the remaining work is NumPy and PNG
+        # encoding, so the materials are generated concurrently
         with patch.dict(os.environ, {'OPENAI_API_KEY': 'test-key'}):
-            generator = PBRGenerator()
-            
-            # Generate multiple materials
-            materials = [
-                ("granite floor", "stone"),
-                ("steel panel", "metal"),
-                ("oak planks", "wood")
-            ]
-            
-            for prompt, mat_type in materials:
-                output_dir = os.path.join(temp_dir, mat_type, prompt.replace(' ', '_'))
-                generator.generate_material(
-                    prompt=prompt,
-                    output_dir=output_dir,
-                    material_type=mat_type,
-                    size=256
-                )
-            
-            # Verify directory structure
-            assert os.path.exists(os.path.join(temp_dir, 'stone', 'granite_floor'))
-            assert os.path.exists(os.path.join(temp_dir, 'metal', 'steel_panel'))
-            assert os.path.exists(os.path.join(temp_dir, 'wood', 'oak_planks'))
-            
-            # Each should contain 6 texture maps
-            for prompt, mat_type in materials:
-                mat_dir = os.path.join(temp_dir, mat_type, prompt.replace(' ', '_'))
-                files = os.listdir(mat_dir)
-                png_files = [f for f in files if f.endswith('.png')]
-                assert len(png_files) == 6
+            with ThreadPoolExecutor(max_workers=len(materials)) as executor:
+                list(executor.map(generate, materials))
+        
+        # Verify directory structure
+        assert os.path.exists(os.path.join(temp_dir, 'stone', 'granite_floor'))
+        assert os.path.exists(os.path.join(temp_dir, 'metal', 'steel_panel'))
+        assert os.path.exists(os.path.join(temp_dir, 'wood', 'oak_planks'))
+        
+        # Each should contain 6 texture maps
+        for prompt, mat_type in materials:
+            mat_dir = os.path.join(temp_dir, mat_type, prompt.replace(' ', '_'))
+            with os.scandir(mat_dir) as it:
+                png_files = [entry for entry in it if entry.name.endswith('.png')]
+            assert len(png_files) == 6
 
 
 class TestPerformance:
     """Test performance aspects of the pipeline."""
     
-    @patch('openai.OpenAI')
-    def test_memory_usage(self, mock_openai_class, mock_image_download, temp_dir):
+    def test_memory_usage(self, mock_openai, mock_image_download, temp_dir, pbr_generator,
+                          save_registry):
         """Test that memory usage is reasonable."""
-        # Setup mock
-        mock_client = Mock()
-        mock_openai_class.return_value = mock_client
+        generator = pbr_generator
+        generator._client = mock_openai
         
-        mock_response = Mock()
-        mock_response.data = [Mock(url="https://test.com/image.png")]
-        mock_client.images.generate.return_value = mock_response
+        # Generate a large texture
+        output_dir = os.path.join(temp_dir, 'large_texture')
         
-        with patch.dict(os.environ, {'OPENAI_API_KEY': 'test-key'}):
-            generator = PBRGenerator()
-            
-            # Generate a large texture
-            output_dir = os.path.join(temp_dir, 'large_texture')
-            
-            # This should complete without memory issues
-            generator.generate_material(
-                prompt="detailed surface",
-                output_dir=output_dir,
-                material_type="stone",
-                size=1024
-            )
-            
-            # Verify files exist and are correct size
-            for filename in os.listdir(output_dir):
-                if filename.endswith('.png'):
-                    img = Image.open(os.path.join(output_dir, filename))
-                    assert img.size == (1024, 1024)
+        # This should complete without memory issues
+        generator.generate_material(
+            prompt="detailed surface",
+            output_dir=output_dir,
+            material_type="stone",
+            size=1024
+        )
+        
+        # Verify outputs exist and are correct size; the 1024x1024 maps are
+        # kept in memory by save_registry rather than written to disk
+        outputs = [
+            buffer for path, buffer in save_registry.items()
+            if os.path.dirname(path) == output_dir and path.endswith('.png')
+        ]
+        assert outputs
+        for buffer in outputs:
+            size, _ = _png_header(buffer.getvalue())
+            assert size == (1024, 1024)
     
-    @patch('openai.OpenAI')
-    def test_concurrent_safety(self, mock_openai_class, mock_image_download, temp_dir):
+    def test_concurrent_safety(self, mock_openai, mock_image_download, temp_dir):
         """Test that the pipeline can handle concurrent requests safely."""
-        # Setup mock
-        mock_client = Mock()
-        mock_openai_class.return_value = mock_client
-        
-        mock_response = Mock()
-        mock_response.data = [Mock(url="https://test.com/image.png")]
-        mock_client.images.generate.return_value = mock_response
-        
         with patch.dict(os.environ, {'OPENAI_API_KEY': 'test-key'}):
             # Create multiple generators
             generators = [PBRGenerator() for _ in range(3)]
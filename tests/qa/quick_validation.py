@@ -43,21 +43,18 @@ def test_basic_generation():
     
     try:
         from src.types.common import TextureType, Resolution
-        from PIL import Image
         import numpy as np
         
-        # Create a test image using PIL directly
+        # Create the test image directly as an array; the tessellation
+        # methods take numpy input, so there is no need to go through PIL
         resolution = Resolution(width=256, height=256)
-        test_image = Image.new('RGB', (resolution.width, resolution.height), (128, 128, 128))
+        img_array = np.full((resolution.height, resolution.width, 3), 128, dtype=np.uint8)
         print("✅ Created test image")
         
         # Test tessellation
         from src.utils.tessellation import TessellationProcessor
         processor = TessellationProcessor()
         
-        # Convert to numpy array
-        img_array = np.array(test_image)
-        
         # Test offset method
         seamless = processor.make_seamless_offset(img_array, blend_width=32)
         print("✅ Offset tessellation working")
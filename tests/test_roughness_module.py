@@ -1,29 +1,35 @@
 """Test the roughness module implementation."""
 
-import sys
 import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from PIL import Image
 import numpy as np
-from modules.roughness import RoughnessModule
+from src.modules.roughness import RoughnessModule
+
+
+# Generated maps are only written for manual inspection when requested
+SAVE_ARTIFACTS = os.environ.get("SAVE_ARTIFACTS") == "1"
+ARTIFACT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _save(image, filename):
+    """Write a test artifact as a fast, lightly compressed PNG if enabled."""
+    if not SAVE_ARTIFACTS:
+        return
+    output_path = os.path.join(ARTIFACT_DIR, filename)
+    image.save(output_path, format='PNG', optimize=False, compress_level=1)
+    print(f"  - Saved to: {output_path}")
 
 
 def test_roughness_generation():
     """Test basic roughness map generation."""
     # Create a simple test diffuse image
     width, height = 256, 256
-    test_image = Image.new('RGB', (width, height))
-    
-    # Create a gradient pattern for testing
-    pixels = []
-    for y in range(height):
-        for x in range(width):
-            # Create horizontal gradient
-            value = int((x / width) * 255)
-            pixels.append((value, value, value))
     
-    test_image.putdata(pixels)
+    # Create a horizontal gradient pattern for testing
+    gradient = (np.arange(width) * 255 // width).astype(np.uint8)
+    pixels = np.broadcast_to(gradient[None, :, None], (height, width, 3))
+    test_image = Image.fromarray(np.ascontiguousarray(pixels), 'RGB')
     
     # Test with different materials
     materials = ['stone', 'metal', 'wood', 'fabric']
@@ -54,26 +60,19 @@ def test_roughness_generation():
         print(f"  - Value range: [{min_val:.3f}, {max_val:.3f}]")
         
         # Save test output
-        output_path = f"/workspace/ext/tessellating-pbr-generator/tests/test_roughness_{material}.png"
-        roughness_map.save(output_path)
-        print(f"  - Saved to: {output_path}")
+        _save(roughness_map, f"test_roughness_{material}.png")
 
 
 def test_height_based_generation():
     """Test roughness generation from height map."""
     # Create a test height map with some variation
     width, height = 256, 256
-    height_map = Image.new('L', (width, height))
     
-    # Create a pattern with varying heights
-    pixels = []
-    for y in range(height):
-        for x in range(width):
-            # Create a wavy pattern
-            value = int(128 + 100 * np.sin(x * 0.1) * np.sin(y * 0.1))
-            pixels.append(value)
-    
-    height_map.putdata(pixels)
+    # Create a wavy pattern with varying heights
+    wave_x = 100 * np.sin(np.arange(width) * 0.1)
+    wave_y = np.sin(np.arange(height) * 0.1)
+    pixels = 128 + wave_x[None, :] * wave_y[:, None]
+    height_map = Image.fromarray(pixels.astype(np.uint8), 'L')
     
     print("\nTesting height-based roughness generation...")
     
@@ -91,9 +90,7 @@ def test_height_based_generation():
     print(f"  - Size: {roughness_map.size}")
     
     # Save test output
-    output_path = "/workspace/ext/tessellating-pbr-generator/tests/test_roughness_from_height.png"
-    roughness_map.save(output_path)
-    print(f"  - Saved to: {output_path}")
+    _save(roughness_map, "test_roughness_from_height.png")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,74 @@
+"""Unit tests for file handling utilities."""
+
+import io
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+from src.utils.file_handlers import DEFAULT_PNG_COMPRESS_LEVEL, save_image, save_texture
+
+
+@pytest.fixture
+def image():
+    """Small solid-colour RGB image."""
+    return Image.new('RGB', (64, 64), color=(100, 100, 100))
+
+
+class TestSaveImage:
+    """Test that save_image applies the PNG compression level."""
+    
+    def test_png_compression_level(self, image, tmp_path):
+        """Test that PNG textures are written at the configured zlib level."""
+        png_path = tmp_path / 'weathered_metal_diffuse.png'
+        
+        with patch.object(Image.Image, 'save', autospec=True) as mock_save:
+            save_image(image, png_path)
+            save_image(image, png_path, compress_level=6)
+        
+        assert mock_save.call_args_list[0].kwargs['compress_level'] == DEFAULT_PNG_COMPRESS_LEVEL == 1
+        assert mock_save.call_args_list[1].kwargs['compress_level'] == 6
+        
+        # The real write produces a readable file
+        save_image(image, png_path)
+        with Image.open(png_path) as saved:
+            assert saved.size == (64, 64)
+    
+    def test_uppercase_png_suffix(self, image, tmp_path):
+        """Test that the suffix check is case-insensitive."""
+        with patch.object(Image.Image, 'save', autospec=True) as mock_save:
+            save_image(image, tmp_path / 'TEXTURE.PNG', compress_level=3)
+        
+        assert mock_save.call_args.kwargs['compress_level'] == 3
+    
+    @pytest.mark.parametrize('filename', ['texture.jpg', 'texture.tga', 'texture.bmp'])
+    def test_non_png_gets_no_compress_level(self, image, tmp_path, filename):
+        """Test that other formats are saved without PNG-only options."""
+        with patch.object(Image.Image, 'save', autospec=True) as mock_save:
+            save_image(image, tmp_path / filename, compress_level=6)
+        
+        assert 'compress_level' not in mock_save.call_args.kwargs
+        assert 'optimize' not in mock_save.call_args.kwargs
+    
+    def test_non_png_real_write(self, image, tmp_path):
+        """Test that a non-PNG path is written in its own format."""
+        jpg_path = tmp_path / 'texture.jpg'
+        save_image(image, jpg_path)
+        
+        with Image.open(jpg_path) as saved:
+            assert saved.format == 'JPEG'
+            assert saved.size == (64, 64)
+
+
+class TestSaveTexture:
+    """Test saving encoded texture bytes."""
+    
+    def test_save_texture_creates_directory(self, image, tmp_path):
+        """Test that encoded bytes are re-saved into a new directory."""
+        buffer = io.BytesIO()
+        image.save(buffer, format='PNG')
+        
+        target = tmp_path / 'nested' / 'texture.png'
+        assert save_texture(buffer.getvalue(), str(target))
+        with Image.open(target) as saved:
+            assert saved.size == (64, 64)
@@ -59,11 +59,8 @@ class TestNormalMapGenerator:
         """Test that edges are properly detected in normal map."""
         # Create an image with clear edges
         edge_image = Image.new('RGB', (100, 100), 'white')
-        pixels = edge_image.load()
         # Create a black square in the middle
-        for x in range(40, 60):
-            for y in range(40, 60):
-                pixels[x, y] = (0, 0, 0)
+        edge_image.paste((0, 0, 0), (40, 40, 60, 60))
         
         generator = NormalMapGenerator()
         normal_map = generator.generate(edge_image)
@@ -144,12 +141,10 @@ class TestHeightMapGenerator:
     def test_height_from_luminance(self, sample_image):
         """Test that height is derived from luminance."""
         # Create a gradient image
-        gradient = Image.new('RGB', (100, 100))
-        pixels = gradient.load()
-        for y in range(100):
-            gray = int(255 * y / 100)
-            for x in range(100):
-                pixels[x, y] = (gray, gray, gray)
+        rows = (255 * np.arange(100) / 100).astype(np.uint8)
+        gradient_pixels = np.empty((100, 100, 3), dtype=np.uint8)
+        gradient_pixels[:] = rows[:, np.newaxis, np.newaxis]
+        gradient = Image.fromarray(gradient_pixels)
         
         generator = HeightMapGenerator()
         height_map = generator.generate(gradient)
@@ -188,12 +183,9 @@ class TestAOMapGenerator:
         """Test that AO is darker in crevices/edges."""
         # Create image with clear edges
         test_image = Image.new('RGB', (100, 100), 'white')
-        pixels = test_image.load()
         
         # Create a pattern that should have AO
-        for x in range(40, 60):
-            for y in range(40, 60):
-                pixels[x, y] = (128, 128, 128)
+        test_image.paste((128, 128, 128), (40, 40, 60, 60))
         
         generator = AOMapGenerator()
         ao_map = generator.generate(test_image)
@@ -234,14 +226,11 @@ class TestMetallicMapGenerator:
     def test_metallic_detection(self):
         """Test automatic metallic detection from color."""
         # Create an image with metallic-looking colors
-        metallic_image = Image.new('RGB', (100, 100))
-        pixels = metallic_image.load()
-        
         # Add some gray/silver colors (typical for metals)
-        for x in range(100):
-            for y in range(100):
-                gray = 180 + (x % 20)
-                pixels[x, y] = (gray, gray, gray)
+        columns = (180 + np.arange(100) % 20).astype(np.uint8)
+        metallic_pixels = np.empty((100, 100, 3), dtype=np.uint8)
+        metallic_pixels[:] = columns[np.newaxis, :, np.newaxis]
+        metallic_image = Image.fromarray(metallic_pixels)
         
         generator = MetallicMapGenerator()
         metallic_map = generator.generate(metallic_image, auto_detect=True)
@@ -0,0 +1,209 @@
+"""Unit tests for the OpenAI image generation interface."""
+
+import asyncio
+import base64
+import os
+import time
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+import pytest
+
+from src.interfaces.openai_api import OpenAIInterface, _DiskCache
+
+
+PAYLOAD = {
+    "model": "gpt-image-1",
+    "prompt": "weathered stone",
+    "n": 1,
+    "size": "1024x1024",
+    "quality": "auto",
+}
+
+
+class TestDiskCache:
+    """Test the file-backed image cache."""
+    
+    def test_put_get_round_trip(self, tmp_path):
+        """Test that stored bytes are returned for the same key."""
+        cache = _DiskCache(str(tmp_path))
+        key = cache.key(PAYLOAD)
+        
+        assert cache.get(key) is None
+        cache.put(key, b"image bytes")
+        assert cache.get(key) == b"image bytes"
+    
+    def test_key_depends_on_request_fields(self):
+        """Test that a different prompt maps to a different key."""
+        other = dict(PAYLOAD, prompt="polished marble")
+        assert _DiskCache.key(PAYLOAD) == _DiskCache.key(dict(PAYLOAD))
+        assert _DiskCache.key(PAYLOAD) != _DiskCache.key(other)
+    
+    def test_put_leaves_no_temp_files(self, tmp_path):
+        """Test that the atomic write does not leave its temp file behind."""
+        cache = _DiskCache(str(tmp_path / "cache"))
+        key = cache.key(PAYLOAD)
+        cache.put(key, b"first")
+        cache.put(key, b"second")
+        
+        assert cache.get(key) == b"second"
+        assert list((tmp_path / "cache").glob("*.tmp")) == []
+        assert [p.name for p in (tmp_path / "cache").iterdir()] == [f"{key}.img"]
+    
+    def test_expired_entry_is_a_miss(self, tmp_path):
+        """Test that entries older than the TTL are not returned."""
+        cache = _DiskCache(str(tmp_path), ttl=60.0)
+        key = cache.key(PAYLOAD)
+        cache.put(key, b"image bytes")
+        
+        stale = time.time() - 120
+        os.utime(tmp_path / f"{key}.img", (stale, stale))
+        assert cache.get(key) is None
+    
+    @pytest.mark.parametrize("ttl", [0, -1])
+    def test_non_positive_ttl_never_expires(self, tmp_path, ttl):
+        """Test that a TTL of 0 or less keeps entries indefinitely."""
+        cache = _DiskCache(str(tmp_path), ttl=ttl)
+        key = cache.key(PAYLOAD)
+        cache.put(key, b"image bytes")
+        
+        ancient = time.time() - 10 * 365 * 24 * 3600
+        os.utime(tmp_path / f"{key}.img", (ancient, ancient))
+        assert cache.get(key) == b"image bytes"
+
+
+class TestGenerateImageCache:
+    """Test that generate_image consults the cache before the API."""
+    
+    def test_second_call_served_from_cache(self, tmp_path):
+        """Test that an identical request does not reach the API again."""
+        interface = OpenAIInterface("test-key", cache_dir=str(tmp_path))
+        
+        with patch.object(interface, "_request_image",
+                          AsyncMock(return_value=b"image bytes")) as mock_request:
+            first = asyncio.run(interface.generate_image("weathered stone"))
+            second = asyncio.run(interface.generate_image("weathered stone"))
+            assert mock_request.await_count == 1
+            
+            # A different prompt is a cache miss
+            asyncio.run(interface.generate_image("polished marble"))
+            assert mock_request.await_count == 2
+        
+        assert first == second == b"image bytes"
+    
+    def test_failed_request_is_not_cached(self, tmp_path):
+        """Test that a None result is retried on the next call."""
+        interface = OpenAIInterface("test-key", cache_dir=str(tmp_path))
+        
+        with patch.object(interface, "_request_image",
+                          AsyncMock(side_effect=[None, b"image bytes"])) as mock_request:
+            assert asyncio.run(interface.generate_image("weathered stone")) is None
+            assert asyncio.run(interface.generate_image("weathered stone")) == b"image bytes"
+            assert mock_request.await_count == 2
+    
+    def test_no_cache_dir_always_requests(self):
+        """Test that caching is off when no directory is configured."""
+        interface = OpenAIInterface("test-key")
+        assert interface.cache is None
+        
+        with patch.object(interface, "_request_image",
+                          AsyncMock(return_value=b"image bytes")) as mock_request:
+            asyncio.run(interface.generate_image("weathered stone"))
+            asyncio.run(interface.generate_image("weathered stone"))
+            assert mock_request.await_count == 2
+
+
+class _FakeResponse:
+    """Minimal stand-in for an aiohttp response used as a context manager."""
+    
+    def __init__(self, status, body=None):
+        self.status = status
+        self._body = body
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+    
+    async def text(self):
+        return f"status {self.status}"
+    
+    async def json(self):
+        return self._body
+
+
+class _FakeSession:
+    """aiohttp.ClientSession replacement that replays scripted outcomes.
+    
+    Each post() consumes the next outcome: an HTTP status, or an exception
+    instance to raise. A 200 returns a b64_json body.
+    """
+    
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.post_calls = 0
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+    
+    def post(self, url, **kwargs):
+        self.post_calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        body = {"data": [{"b64_json": base64.b64encode(b"image bytes").decode()}]}
+        return _FakeResponse(outcome, body if outcome == 200 else None)
+
+
+class TestRequestRetries:
+    """Test retry and backoff behaviour of _request_image."""
+    
+    def _run(self, outcomes, retries=3):
+        """Run one request against a scripted session with sleeps patched out."""
+        interface = OpenAIInterface("test-key", retries=retries, retry_delay=0.5)
+        session = _FakeSession(outcomes)
+        with patch("src.interfaces.openai_api.aiohttp.ClientSession", return_value=session), \
+                patch("src.interfaces.openai_api.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            result = asyncio.run(interface._request_image(dict(PAYLOAD)))
+        delays = [call.args[0] for call in mock_sleep.await_args_list]
+        return result, session.post_calls, delays
+    
+    def test_retryable_statuses_then_success(self):
+        """Test that 503 and 429 are retried with exponential backoff."""
+        result, calls, delays = self._run([503, 429, 200])
+        
+        assert result == b"image bytes"
+        assert calls == 3
+        assert delays == [0.5, 1.0]
+    
+    def test_client_error_is_not_retried(self):
+        """Test that a 400 fails after a single attempt."""
+        result, calls, delays = self._run([400, 200])
+        
+        assert result is None
+        assert calls == 1
+        assert delays == []
+    
+    @pytest.mark.parametrize("error", [
+        aiohttp.ClientConnectionError("connection reset"),
+        asyncio.TimeoutError(),
+    ])
+    def test_transient_exceptions_are_retried(self, error):
+        """Test that connection errors and timeouts are retried."""
+        result, calls, delays = self._run([error, 200])
+        
+        assert result == b"image bytes"
+        assert calls == 2
+        assert delays == [0.5]
+    
+    def test_gives_up_after_retries(self):
+        """Test that persistent server errors stop after the retry limit."""
+        result, calls, delays = self._run([503, 503, 503])
+        
+        assert result is None
+        assert calls == 3
+        assert delays == [0.5, 1.0]
@@ -88,16 +88,15 @@ class TestSeamlessTiling:
     def test_tiling_preserves_features(self):
         """Test that tiling preserves important image features."""
         # Create an image with a clear feature
-        test_image = Image.new('RGB', (200, 200), 'white')
-        pixels = test_image.load()
+        image = np.full((200, 200, 3), 255, dtype=np.uint8)
         
         # Draw a circle in the center
         center_x, center_y = 100, 100
         radius = 30
-        for x in range(200):
-            for y in range(200):
-                if (x - center_x)**2 + (y - center_y)**2 <= radius**2:
-                    pixels[x, y] = (255, 0, 0)  # Red circle
+        y, x = np.ogrid[:200, :200]
+        circle = (x - center_x)**2 + (y - center_y)**2 <= radius**2
+        image[circle] = (255, 0, 0)  # Red circle
+        test_image = Image.fromarray(image)
         
         tiling = SeamlessTiling()
         seamless = tiling.make_seamless(test_image)
@@ -117,17 +116,9 @@ class TestSeamlessTiling:
         
         # Create a 2x2 tile
         width, height = seamless.size
-        tiled = Image.new(seamless.mode, (width * 2, height * 2))
-        
-        # Paste the seamless texture 4 times
-        tiled.paste(seamless, (0, 0))
-        tiled.paste(seamless, (width, 0))
-        tiled.paste(seamless, (0, height))
-        tiled.paste(seamless, (width, height))
+        tiled_array = np.tile(np.asarray(seamless), (2, 2, 1))
         
         # Check that seams are not visible
-        tiled_array = np.array(tiled)
-        
         # Check vertical seam in the middle
         left_of_seam = tiled_array[:, width-1]
         right_of_seam = tiled_array[:, width]
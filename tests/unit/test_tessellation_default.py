@@ -7,20 +7,20 @@ import tempfile
 import os
 from unittest.mock import Mock, patch
 
-from src.modules.tessellation import TessellationModule
+
+# Shared PCG64 generator; each noise texture is drawn in a single call
+rng = np.random.default_rng(0)
 
 
 class TestTessellationDefaults:
     """Test suite focusing on tessellation frequency defaults and parameter handling."""
     
-    @pytest.fixture
-    def tessellation_module(self):
-        """Create a TessellationModule instance for testing."""
-        return TessellationModule()
-    
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def test_pattern_image(self):
-        """Create a test pattern image with clear seam visibility."""
+        """Create a test pattern image with clear seam visibility.
+        
+        Built once for the class; make_seamless never modifies its input.
+        """
         width, height = 512, 512
         image = np.zeros((height, width, 3), dtype=np.uint8)
         
@@ -104,7 +104,7 @@ class TestTessellationDefaults:
         """Test frequency blend method default parameters."""
         # Create images with different characteristics
         # Noise-based texture
-        noise_image = np.random.randint(0, 256, (512, 512, 3), dtype=np.uint8)
+        noise_image = rng.integers(0, 256, (512, 512, 3), dtype=np.uint8)
         noise_pil = Image.fromarray(noise_image)
         
         # Smooth gradient texture
@@ -179,9 +179,7 @@ class TestTessellationDefaults:
         """Test frequency domain processing with default parameters."""
         # Create test image with specific frequency content
         width, height = 512, 512
-        x = np.linspace(0, 4 * np.pi, width)
-        y = np.linspace(0, 4 * np.pi, height)
-        X, Y = np.meshgrid(x, y)
+        Y, X = np.ogrid[0:4 * np.pi:height * 1j, 0:4 * np.pi:width * 1j]
         
         # Create pattern with multiple frequencies
         low_freq = np.sin(X) * np.cos(Y)
@@ -199,64 +197,69 @@ class TestTessellationDefaults:
         
         # The frequency method should preserve frequency content while ensuring tiling
     
-    def test_grayscale_image_handling(self, tessellation_module):
-        """Test default handling of grayscale images."""
+    @pytest.fixture(scope="class")
+    def grayscale_images(self):
+        """Create grayscale test patterns keyed by name, shared by the class."""
         # Create various grayscale patterns
         patterns = {
             'gradient': np.linspace(0, 255, 512*512).reshape(512, 512),
             'checkerboard': np.indices((512, 512)).sum(axis=0) % 64 < 32,
-            'noise': np.random.randint(0, 256, (512, 512))
+            'noise': rng.integers(0, 256, (512, 512), dtype=np.uint8)
         }
         
+        grayscale_images = {}
         for pattern_name, pattern_data in patterns.items():
             if pattern_name == 'checkerboard':
                 pattern_data = pattern_data.astype(np.uint8) * 255
             else:
                 pattern_data = pattern_data.astype(np.uint8)
             
-            grayscale_image = Image.fromarray(pattern_data, mode='L')
-            
-            # Test all blend modes with grayscale
-            for blend_mode in ['offset', 'mirror', 'frequency']:
-                result = tessellation_module.make_seamless(
-                    grayscale_image,
-                    blend_mode=blend_mode
-                )
-                
-                assert result.mode == 'L'
-                assert result.size == (512, 512)
+            grayscale_images[pattern_name] = Image.fromarray(pattern_data, mode='L')
+        
+        return grayscale_images
     
-    def test_rgba_image_handling(self, tessellation_module):
-        """Test default handling of RGBA images with transparency."""
-        # Create RGBA test image
-        rgba_array = np.zeros((512, 512, 4), dtype=np.uint8)
+    @pytest.mark.parametrize("blend_mode", ['offset', 'mirror', 'frequency'])
+    @pytest.mark.parametrize("pattern_name", ['gradient', 'checkerboard', 'noise'])
+    def test_grayscale_image_handling(self, tessellation_module, grayscale_images,
+                                      pattern_name, blend_mode):
+        """Test default handling of grayscale images."""
+        result = tessellation_module.make_seamless(
+            grayscale_images[pattern_name],
+            blend_mode=blend_mode
+        )
+        
+        assert result.mode == 'L'
+        assert result.size == (512, 512)
+    
+    @pytest.fixture(scope="class")
+    def rgba_image(self):
+        """Create an RGBA test image with varying transparency, shared by the class."""
+        y, x = np.ogrid[:512, :512]
+        rgba_array = np.empty((512, 512, 4), dtype=np.uint8)
         
         # Add pattern with varying alpha
-        for y in range(512):
-            for x in range(512):
-                rgba_array[y, x] = [
-                    int(255 * x / 512),  # Red gradient
-                    int(255 * y / 512),  # Green gradient
-                    128,                  # Blue constant
-                    int(255 * ((x + y) % 512) / 512)  # Alpha pattern
-                ]
-        
-        rgba_image = Image.fromarray(rgba_array, mode='RGBA')
-        
-        # Test all blend modes with RGBA
-        for blend_mode in ['offset', 'mirror', 'frequency']:
-            result = tessellation_module.make_seamless(
-                rgba_image,
-                blend_mode=blend_mode
-            )
-            
-            assert result.mode == 'RGBA'
-            assert result.size == (512, 512)
-            
-            # Verify alpha channel is preserved
-            result_array = np.array(result)
-            assert result_array.shape[2] == 4
-            assert np.any(result_array[:, :, 3] != 255)  # Alpha varies
+        rgba_array[:, :, 0] = 255 * x // 512  # Red gradient
+        rgba_array[:, :, 1] = 255 * y // 512  # Green gradient
+        rgba_array[:, :, 2] = 128             # Blue constant
+        rgba_array[:, :, 3] = 255 * ((x + y) % 512) // 512  # Alpha pattern
+        
+        return Image.fromarray(rgba_array, mode='RGBA')
+    
+    @pytest.mark.parametrize("blend_mode", ['offset', 'mirror', 'frequency'])
+    def test_rgba_image_handling(self, tessellation_module, rgba_image, blend_mode):
+        """Test default handling of RGBA images with transparency."""
+        result = tessellation_module.make_seamless(
+            rgba_image,
+            blend_mode=blend_mode
+        )
+        
+        assert result.mode == 'RGBA'
+        assert result.size == (512, 512)
+        
+        # Verify alpha channel is preserved
+        result_array = np.array(result)
+        assert result_array.shape[2] == 4
+        assert np.any(result_array[:, :, 3] != 255)  # Alpha varies
     
     def test_tiling_validation_thresholds(self, tessellation_module):
         """Test tiling validation with different threshold values."""
@@ -381,9 +384,7 @@ class TestTessellationDefaults:
         channel = np.zeros((256, 256), dtype=np.float32)
         
         # Add low frequency component
-        x = np.linspace(0, 2 * np.pi, 256)
-        y = np.linspace(0, 2 * np.pi, 256)
-        X, Y = np.meshgrid(x, y)
+        Y, X = np.ogrid[0:2 * np.pi:256j, 0:2 * np.pi:256j]
         channel += np.sin(X) * 127.5 + 127.5
         
         # Process channel
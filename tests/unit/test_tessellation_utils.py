@@ -0,0 +1,73 @@
+"""Unit tests for the apply_tessellation edge blending utility."""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from src.utils.tessellation import apply_tessellation
+
+
+def _reference_blend(array, blend_width):
+    """Straightforward float64 edge blend, rounding half up after each pass."""
+    result = array.astype(np.float64)
+    ramp = np.arange(blend_width) / blend_width
+    blend_x = ramp.reshape((1, blend_width) + (1,) * (array.ndim - 2))
+    blend_y = ramp.reshape((blend_width, 1) + (1,) * (array.ndim - 2))
+    
+    left = result[:, :blend_width].copy()
+    right = result[:, -blend_width:].copy()
+    result[:, :blend_width] = np.floor(blend_x * left + (1 - blend_x) * right + 0.5)
+    result[:, -blend_width:] = np.floor((1 - blend_x) * left + blend_x * right + 0.5)
+    
+    top = result[:blend_width].copy()
+    bottom = result[-blend_width:].copy()
+    result[:blend_width] = np.floor(blend_y * top + (1 - blend_y) * bottom + 0.5)
+    result[-blend_width:] = np.floor((1 - blend_y) * top + blend_y * bottom + 0.5)
+    return result.astype(array.dtype)
+
+
+@pytest.fixture
+def noise():
+    """Random 8-bit RGB pixel data."""
+    return np.random.default_rng(0).integers(0, 256, (128, 160, 3), dtype=np.uint8)
+
+
+class TestApplyTessellation:
+    """Test the rounding of both blend paths."""
+    
+    @pytest.mark.parametrize("grayscale", [False, True])
+    def test_power_of_two_width_matches_reference(self, noise, grayscale):
+        """Test that the integer path rounds half up on each pass."""
+        array = np.ascontiguousarray(noise[..., 0]) if grayscale else noise
+        result = np.asarray(apply_tessellation(Image.fromarray(array), blend_width=32))
+        
+        np.testing.assert_array_equal(result, _reference_blend(array, 32))
+    
+    def test_other_width_rounds_like_integer_path(self, noise):
+        """Test that the float path rounds instead of truncating."""
+        result = np.asarray(apply_tessellation(Image.fromarray(noise), blend_width=24))
+        diff = np.abs(result.astype(int) - _reference_blend(noise, 24).astype(int))
+        
+        # float32 weights can only disagree with float64 on exact ties
+        assert diff.max() <= 1
+        assert (diff > 0).mean() < 0.01
+    
+    def test_16_bit_image_keeps_its_precision(self, noise):
+        """Test that I;16 input is blended in 16 bits and stays I;16."""
+        array = noise[..., 0].astype(np.uint16) * 257
+        result = apply_tessellation(Image.fromarray(array), blend_width=24)
+        
+        assert result.mode == 'I;16'
+        np.testing.assert_array_equal(np.asarray(result), _reference_blend(array, 24))
+    
+    def test_float_image_is_not_quantized(self, noise):
+        """Test that F input stays F and is blended without rounding."""
+        array = noise[..., 0].astype(np.float32) / 255
+        result = apply_tessellation(Image.fromarray(array), blend_width=24)
+        
+        assert result.mode == 'F'
+        blended = np.asarray(result)
+        assert not np.allclose(blended, np.round(blended * 255) / 255)
+        # Interior pixels are untouched
+        np.testing.assert_array_equal(blended[24:-24, 24:-24], array[24:-24, 24:-24])
+
@@ -0,0 +1,113 @@
+"""Unit tests for the TextureGenerator base class."""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from src.modules.base import TextureGenerator
+from src.modules.tessellation import TessellationModule
+from src.types.common import Resolution, TextureFormat, TextureType
+from src.types.config import Config, MaterialProperties, TextureConfig
+
+
+class _DiffuseGenerator(TextureGenerator):
+    """Minimal concrete generator for exercising base class behaviour."""
+    
+    @property
+    def texture_type(self) -> TextureType:
+        return TextureType.DIFFUSE
+    
+    def generate(self, input_data=None) -> Image.Image:
+        return Image.new('RGB', (self.resolution.width, self.resolution.height))
+
+
+def _make_generator(seamless=True, seamless_threshold=0.1):
+    """Build a generator from a config with the given seamless settings."""
+    texture_config = TextureConfig(
+        resolution=Resolution(256, 256),
+        format=TextureFormat.PNG,
+        types=[TextureType.DIFFUSE],
+        seamless=seamless,
+        seamless_threshold=seamless_threshold
+    )
+    config = Config(
+        project_name="test",
+        project_version="1.0.0",
+        texture_config=texture_config,
+        material="stone",
+        style="weathered",
+        material_properties=MaterialProperties(),
+        model="gpt-image-1",
+        output_directory="./output",
+        naming_convention="{material}_{type}"
+    )
+    return _DiffuseGenerator(config)
+
+
+def _edge_step_image(step):
+    """Grayscale image whose opposite edges differ by ``step`` of full range.
+    
+    The interior is a symmetric ramp, so only the last row and column
+    carry the seam.
+    """
+    ramp = np.abs(np.arange(128) - 63.5).astype(np.float32)
+    array = np.add.outer(ramp, ramp)
+    array[-1, :] += step * 255
+    array[:, -1] += step * 255
+    return Image.fromarray(np.clip(array, 0, 255).astype(np.uint8))
+
+
+@pytest.fixture
+def mock_blend():
+    """Patch the tessellation blend so calls can be counted."""
+    with patch.object(TessellationModule, 'make_seamless', autospec=True,
+                      side_effect=lambda self, image, **kwargs: image) as mock:
+        yield mock
+
+
+class TestMakeSeamless:
+    """Test the tiling check in front of the seamless blend."""
+    
+    def test_tiling_image_skips_blend(self, mock_blend):
+        """Test that an image that already tiles is returned unchanged."""
+        image = _edge_step_image(0.0)
+        
+        result = _make_generator().make_seamless(image)
+        
+        assert result is image
+        mock_blend.assert_not_called()
+    
+    def test_seamed_image_is_blended(self, mock_blend):
+        """Test that visible seams run the frequency blend once."""
+        image = _edge_step_image(0.5)
+        
+        _make_generator().make_seamless(image, blend_width=32)
+        
+        mock_blend.assert_called_once()
+        assert mock_blend.call_args.kwargs == {'blend_mode': 'frequency', 'blend_width': 32}
+    
+    @pytest.mark.parametrize("threshold, blended", [(0.1, True), (0.3, False)])
+    def test_threshold_comes_from_texture_config(self, mock_blend, threshold, blended):
+        """Test that TextureConfig.seamless_threshold decides the skip."""
+        image = _edge_step_image(0.2)
+        generator = _make_generator(seamless_threshold=threshold)
+        
+        with patch.object(TessellationModule, 'validate_tiling', autospec=True,
+                          side_effect=TessellationModule.validate_tiling) as mock_validate:
+            generator.make_seamless(image)
+        
+        assert mock_validate.call_args.kwargs['threshold'] == threshold
+        assert mock_blend.called is blended
+    
+    def test_seamless_disabled(self, mock_blend):
+        """Test that nothing is checked or blended when seamless is off."""
+        image = _edge_step_image(0.5)
+        
+        with patch.object(TessellationModule, 'validate_tiling') as mock_validate:
+            result = _make_generator(seamless=False).make_seamless(image)
+        
+        assert result is image
+        mock_validate.assert_not_called()
+        mock_blend.assert_not_called()
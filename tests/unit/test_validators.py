@@ -0,0 +1,58 @@
+"""Unit tests for configuration and texture type validators."""
+
+import pytest
+
+from src.types.common import TextureType
+from src.utils.validators import validate_config, validate_texture_type
+
+
+@pytest.fixture
+def minimal_config():
+    """Smallest configuration that satisfies the schema."""
+    return {
+        "project": {"name": "test-pbr-generator", "version": "1.0.0"},
+        "textures": {
+            "resolution": {"width": 1024, "height": 1024},
+            "format": "png",
+            "types": ["diffuse", "normal"]
+        },
+        "material": {"base_material": "stone"},
+        "output": {"directory": "./output"}
+    }
+
+
+class TestValidateConfig:
+    """Test schema validation of configuration dictionaries."""
+    
+    def test_valid_config(self, minimal_config):
+        """Test that a schema-conforming config passes."""
+        assert validate_config(minimal_config)
+    
+    def test_missing_required_section(self, minimal_config):
+        """Test that a missing top-level section fails."""
+        del minimal_config["material"]
+        assert not validate_config(minimal_config)
+    
+    def test_resolution_below_minimum(self, minimal_config):
+        """Test that a resolution under 128 pixels fails."""
+        minimal_config["textures"]["resolution"]["width"] = 64
+        assert not validate_config(minimal_config)
+    
+    def test_unknown_texture_type(self, minimal_config):
+        """Test that a texture type outside the schema enum fails."""
+        minimal_config["textures"]["types"].append("specular")
+        assert not validate_config(minimal_config)
+
+
+class TestValidateTextureType:
+    """Test texture type name checks."""
+    
+    @pytest.mark.parametrize("texture_type", list(TextureType))
+    def test_every_enum_value_is_valid(self, texture_type):
+        """Test that each TextureType value is accepted."""
+        assert validate_texture_type(texture_type.value)
+    
+    @pytest.mark.parametrize("name", ["specular", "Diffuse", "AMBIENT_OCCLUSION", ""])
+    def test_unknown_names_are_rejected(self, name):
+        """Test that enum member names and unknown types are rejected."""
+        assert not validate_texture_type(name)